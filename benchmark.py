@@ -0,0 +1,56 @@
+"""
+Compares CPU throughput of the execution modes on the same ROM.
+
+    python benchmark.py games/snake.gb --frames 120 --repeat 3
+"""
+import argparse
+import logging
+import time
+from pathlib import Path
+
+from phase2.cpu import CPU
+from phase2.motherboard import Motherboard
+from utils import map_file
+
+# Mode -> compile_blocks
+MODES = {
+    'interpreter': False,
+    'blocks': True,
+}
+
+
+def create_cpu(compile_blocks, game_data):
+    # Without a boot ROM, map the cartridge header page and start at the entry point
+    boot_data = game_data[:0x100]
+    mb = Motherboard(boot_data, game_data, testing=False)
+    cpu = CPU(mb, compile_blocks=compile_blocks)
+    cpu.PC = 0x100
+    cpu.SP = 0xFFFE
+    return cpu
+
+
+def run(game_data, frames, repeat):
+    for name, compile_blocks in MODES.items():
+        # Best of `repeat` runs, the slower ones are mostly scheduler noise
+        elapsed = None
+        for _ in range(repeat):
+            cpu = create_cpu(compile_blocks, game_data)
+
+            start = time.perf_counter()
+            for _ in range(frames):
+                cpu.run_frame()
+            run_time = time.perf_counter() - start
+            elapsed = run_time if elapsed is None else min(elapsed, run_time)
+
+        print(f"{name:<22} {cpu.cycles / elapsed / 1e6:6.2f} MHz  {frames / elapsed:7.1f} fps")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('rom', type=Path)
+    parser.add_argument('--frames', type=int, default=120)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    run(map_file(args.rom), args.frames, args.repeat)
@@ -0,0 +1,173 @@
+"""
+Runs a ROM without a window or input devices: no pyxel, no pynput.
+
+    python headless.py games/snake.gb --frames 600 --dump-dir frames --dump-every 60
+    python -m headless games/snake.gb --cycles 50000000 --json
+"""
+import argparse
+import json
+import logging
+import time
+from pathlib import Path
+
+from phase2.cpu import CPU, FRAME_RATE
+from phase2.motherboard import Motherboard
+from phase2.pacing import Pacer
+from phase3.renderer import SCREEN_WIDTH, SCREEN_HEIGHT
+from utils import map_file
+
+# Shade (0 white .. 3 black) -> grey level in the dumped images
+GREYS = bytes.maketrans(bytes(range(4)), bytes((255, 170, 85, 0)))
+
+# Registers the boot ROM leaves behind, for running without one
+POST_BOOT_IO = {0xFF40: 0x91, 0xFF47: 0xFC, 0xFF48: 0xFF, 0xFF49: 0xFF, 0xFF50: 0x01}
+
+
+def create_emulator(game_data, boot_data=None, compile_blocks=False, skip_idle_loops=False, renderer='auto'):
+    """
+    Builds Motherboard + CPU (+ the PPU the motherboard owns). Without a boot ROM the CPU starts
+    at the cartridge entry point with the registers and LCD state the boot ROM would have left.
+    """
+    mb = Motherboard(boot_data if boot_data is not None else game_data[:0x100], game_data, testing=False,
+                     renderer=renderer)
+    cpu = CPU(mb, compile_blocks=compile_blocks, skip_idle_loops=skip_idle_loops)
+
+    if boot_data is None:
+        cpu.AF = 0x01B0
+        cpu.BC = 0x0013
+        cpu.DE = 0x00D8
+        cpu.HL = 0x014D
+        cpu.SP = 0xFFFE
+        cpu.PC = 0x0100
+        for address, value in POST_BOOT_IO.items():
+            mb.set_byte(address, value)
+
+    return mb, cpu
+
+
+def dump_frame(frame, path):
+    # Binary PGM: readable by most image tools, no imaging library needed
+    with open(path, 'wb') as f:
+        f.write(f"P5 {SCREEN_WIDTH} {SCREEN_HEIGHT} 255\n".encode('ascii'))
+        f.write(bytes(frame).translate(GREYS))
+
+
+def run(mb, cpu, frames=None, cycles=None, dump_dir=None, dump_every=0, pacer=None):
+    """
+    Runs frame by frame until `frames` frames or `cycles` T-cycles, whichever comes first.
+    With the PPU rendering on demand, a frame is requested one frame ahead of every dump.
+    Unthrottled unless a `pacer` holds it to real time.
+
+    :return: stats
+    """
+    if frames is None and cycles is None:
+        frames = 60
+    frame_cycles = round(cpu.tick_rate / FRAME_RATE)
+    limit = cycles if cycles is not None else frames * frame_cycles
+    if frames is not None:
+        limit = min(limit, frames * frame_cycles)
+
+    if dump_dir is not None:
+        dump_dir.mkdir(parents=True, exist_ok=True)
+
+    ppu = mb.ppu
+    dumped = 0
+    frames_run = 0
+    start = time.perf_counter()
+    end = cpu.cycles + limit
+    while cpu.cycles < end:
+        if ppu.render_on_demand and dump_dir is not None and dump_every and (frames_run + 2) % dump_every == 0:
+            ppu.request_frame()
+
+        if end - cpu.cycles >= cpu.frame_budget:
+            cpu.run_frame()
+        else:
+            # Partial last frame of a cycle budget
+            cpu.run_cycles(end - cpu.cycles)
+        if pacer is not None:
+            pacer.wait()
+        frames_run += 1
+        if dump_dir is not None and dump_every and frames_run % dump_every == 0:
+            dump_frame(ppu.frame, dump_dir / f"frame_{frames_run:06d}.pgm")
+            dumped += 1
+    elapsed = time.perf_counter() - start
+
+    stats = {
+        'frames': frames_run,
+        'lcd_frames': ppu.frames,
+        'frames_rendered': ppu.frames_rendered,
+        'cycles': cpu.cycles,
+        'seconds': round(elapsed, 4),
+        'mhz': round(cpu.cycles / elapsed / 1e6, 3) if elapsed else 0.0,
+        'fps': round(frames_run / elapsed, 2) if elapsed else 0.0,
+        'speed': round(cpu.cycles / elapsed / cpu.tick_rate, 3) if elapsed else 0.0,
+        'halted_cycles': cpu.halted_cycles,
+        'tiles_decoded': ppu.tile_cache.decoded,
+        'sprite_index_rebuilds': ppu.renderer.sprites.rebuilds,
+        'renderer': type(ppu.renderer).__name__,
+        'frames_dumped': dumped,
+        'pc': f"{cpu.PC:04X}",
+    }
+    if cpu.idle_loops is not None:
+        stats.update(cpu.idle_loops.stats())
+    if pacer is not None:
+        stats['pacer_resyncs'] = pacer.resyncs
+    return stats
+
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('rom', type=Path)
+    parser.add_argument('--boot', type=Path, help="boot ROM, skipped when omitted")
+    parser.add_argument('--frames', type=int)
+    parser.add_argument('--cycles', type=int)
+    parser.add_argument('--blocks', action='store_true', help="compiled basic blocks")
+    parser.add_argument('--skip-idle', action='store_true', help="skip busy-wait polling loops")
+    parser.add_argument('--renderer', choices=('auto', 'numpy', 'python'), default='auto')
+    parser.add_argument('--speed', choices=('1', '2', '4', 'unlimited'), default='unlimited',
+                        help="pace to real time (59.73 fps) times this")
+    parser.add_argument('--frameskip', type=positive_int, default=1, help="compose 1 of every N frames")
+    parser.add_argument('--render-on-demand', action='store_true', help="only compose frames that get dumped")
+    parser.add_argument('--dump-dir', type=Path, help="write frames here as PGM")
+    parser.add_argument('--dump-every', type=int, default=60, help="dump every Nth frame")
+    parser.add_argument('--json', action='store_true', help="stats as JSON")
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    boot_data = map_file(args.boot) if args.boot else None
+    mb, cpu = create_emulator(map_file(args.rom), boot_data,
+                              compile_blocks=args.blocks, skip_idle_loops=args.skip_idle,
+                              renderer=args.renderer)
+    if boot_data is not None:
+        # Copied into memory, the cartridge owns the only mapping still needed
+        boot_data.close()
+    mb.ppu.frameskip = args.frameskip
+    mb.ppu.render_on_demand = args.render_on_demand
+    pacer = None if args.speed == 'unlimited' else Pacer(turbo=int(args.speed))
+    try:
+        stats = run(mb, cpu, frames=args.frames, cycles=args.cycles, dump_dir=args.dump_dir,
+                    dump_every=args.dump_every, pacer=pacer)
+    finally:
+        mb.close()
+
+    stats['rom'] = args.rom.name
+    stats['cartridge'] = type(mb.cartridge).__name__
+    if args.json:
+        print(json.dumps(stats))
+    else:
+        for key, value in stats.items():
+            print(f"{key:<24} {value}")
+
+
+if __name__ == '__main__':
+    main()
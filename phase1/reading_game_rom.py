@@ -1,9 +1,8 @@
-from pathlib import Path
+from utils import map_file
 
 
-def phase_1_game_rom():
-    game = Path('games/snake.gb')
-    game_data = game.read_bytes()
+def phase_1_game_rom(path='games/snake.gb'):
+    game_data = map_file(path)
 
     print(f"Length of cartridge data: {len(game_data)}")
 
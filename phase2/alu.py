@@ -0,0 +1,122 @@
+"""
+Precomputed ALU tables.
+
+Every entry packs the 8-bit result and the resulting flags as ``(result << 8) | F``, so an
+arithmetic handler is one index, one shift and one mask. The tables are built once on import.
+"""
+from array import array
+
+FLAG_Z = 0b10000000
+FLAG_N = 0b01000000
+FLAG_H = 0b00100000
+FLAG_C = 0b00010000
+
+# (F & FLAG_C) shifted onto the carry bit of each index
+CARRY_16 = 12  # 64K tables: carry << 16 | A << 8 | operand
+CARRY_8 = 4    # 512 entry tables: carry << 8 | value
+
+
+def pack(result, flags):
+    return ((result & 0xFF) << 8) | flags
+
+
+def zero(result):
+    return FLAG_Z if result & 0xFF == 0 else 0
+
+
+def build_adc_table():
+    # ADD is the carry-less half of the table
+    table = array('H', bytes(2 * 0x20000))
+    for carry in (0, 1):
+        for a in range(0x100):
+            for b in range(0x100):
+                result = a + b + carry
+                flags = zero(result)
+                flags |= FLAG_H if (a & 0xF) + (b & 0xF) + carry > 0xF else 0
+                flags |= FLAG_C if result > 0xFF else 0
+                table[(carry << 16) | (a << 8) | b] = pack(result, flags)
+    return table
+
+
+def build_sbc_table():
+    # SUB and CP are the carry-less half, CP only keeps the flags
+    table = array('H', bytes(2 * 0x20000))
+    for carry in (0, 1):
+        for a in range(0x100):
+            for b in range(0x100):
+                result = a - b - carry
+                flags = FLAG_N | zero(result)
+                flags |= FLAG_H if (a & 0xF) - (b & 0xF) - carry < 0 else 0
+                flags |= FLAG_C if result < 0 else 0
+                table[(carry << 16) | (a << 8) | b] = pack(result, flags)
+    return table
+
+
+def build_logic_table(flags):
+    # AND/OR/XOR results are cheap, only the flags are looked up
+    return array('B', [zero(result) | flags for result in range(0x100)])
+
+
+def build_inc_table():
+    # Carry is left untouched by INC/DEC, the handler keeps it from F
+    return array('H', [pack(value + 1, zero(value + 1) | (FLAG_H if value & 0xF == 0xF else 0))
+                       for value in range(0x100)])
+
+
+def build_dec_table():
+    return array('H', [pack(value - 1, FLAG_N | zero(value - 1) | (FLAG_H if value & 0xF == 0 else 0))
+                       for value in range(0x100)])
+
+
+def build_shift_table(fn, with_carry=False):
+    """
+    `fn(value, carry)` returns the 9-bit result, bit 8 being the carry out.
+    """
+    table = array('H', bytes(2 * (0x200 if with_carry else 0x100)))
+    for carry in ((0, 1) if with_carry else (0,)):
+        for value in range(0x100):
+            result = fn(value, carry)
+            table[(carry << 8) | value] = pack(result, zero(result) | (FLAG_C if result > 0xFF else 0))
+    return table
+
+
+def build_daa_table():
+    # Indexed by N, H and C from F and the current A: (F & 0x70) << 4 | A
+    table = array('H', bytes(2 * 0x800))
+    for flags in range(0x8):
+        n, h, c = flags & 0b100, flags & 0b010, flags & 0b001
+        for a in range(0x100):
+            result = a
+            corr = 0
+            corr |= 0x06 if h else 0x00
+            corr |= 0x60 if c else 0x00
+            if n:
+                result -= corr
+            else:
+                corr |= 0x06 if (result & 0x0F) > 0x09 else 0x00
+                corr |= 0x60 if result > 0x99 else 0x00
+                result += corr
+            out = zero(result) | (FLAG_N if n else 0) | (FLAG_C if corr & 0x60 else 0)
+            table[(flags << 8) | a] = pack(result, out)
+    return table
+
+
+ADC_TABLE = build_adc_table()
+SBC_TABLE = build_sbc_table()
+
+AND_FLAGS = build_logic_table(FLAG_H)
+OR_FLAGS = build_logic_table(0)  # XOR shares it
+
+INC_TABLE = build_inc_table()
+DEC_TABLE = build_dec_table()
+
+RLC_TABLE = build_shift_table(lambda v, c: (v << 1) | (v >> 7))
+RRC_TABLE = build_shift_table(lambda v, c: (v >> 1) | ((v & 1) << 7) | ((v & 1) << 8))
+RL_TABLE = build_shift_table(lambda v, c: (v << 1) | c, with_carry=True)
+RR_TABLE = build_shift_table(lambda v, c: (v >> 1) | (c << 7) | ((v & 1) << 8), with_carry=True)
+SLA_TABLE = build_shift_table(lambda v, c: v << 1)
+SRA_TABLE = build_shift_table(lambda v, c: (v >> 1) | (v & 0x80) | ((v & 1) << 8))
+SRL_TABLE = build_shift_table(lambda v, c: (v >> 1) | ((v & 1) << 8))
+SWAP_TABLE = build_shift_table(lambda v, c: ((v & 0xF0) >> 4) | ((v & 0x0F) << 4))
+
+DAA_TABLE = build_daa_table()
@@ -0,0 +1,260 @@
+import ast
+import copy
+import inspect
+import logging
+import sys
+import textwrap
+
+logging.basicConfig(stream=sys.stdout,
+                    level=logging.INFO,
+                    format='[%(asctime)s] {%(filename)s:%(lineno)d} %(levelname)s - %(message)s')
+
+# Anything that moves PC somewhere other than the next instruction, or changes
+# how the next instruction is picked, closes a block
+TERMINATORS = {'JR', 'JP', 'CALL', 'RET', 'RETI', 'RST', 'HALT', 'STOP', 'EI', 'DI', 'PREFIX'}
+MAX_BLOCK_LENGTH = 64
+RAM_START = 0x8000
+EXTERNAL_RAM = (0xA000, 0xC000)
+
+# Pseudo banks in block keys, next to the real ROM and cartridge RAM bank numbers
+BOOT_BANK = -1
+RAM_DISABLED_BANK = -2
+BANK_LABELS = {BOOT_BANK: 'boot', RAM_DISABLED_BANK: 'off'}
+
+
+class BlockCompiler:
+    """
+    Turns straight-line runs of instructions into one cached Python function.
+
+    The body of every instruction is taken from the CPU's own handler (``LD_xx``, ``ADD_xx``, ...),
+    with ``value`` replaced by the decoded operand and the per-instruction ``PC`` bookkeeping folded
+    into a single assignment. The last instruction of a block (a jump, call, return, ...) is called
+    through its handler so the branch logic stays in one place.
+
+    The scheduler's clock is only published between blocks, so before any instruction that touches
+    memory or the interrupt controller the block adds the cycles run so far to ``scheduler.cycles``:
+    DIV/TIMA reads, timer and LCD writes and EI's delay then see the same clock as in the interpreter.
+
+    Blocks are keyed by (address, bank): the ROM bank, the cartridge RAM bank for 0xA000-0xBFFF,
+    BOOT_BANK for boot ROM code so it never aliases the cartridge's. A bank switch therefore never
+    runs code compiled from another bank. Blocks that live in RAM are tracked in ``code_map`` so a
+    write to any of their bytes drops them from the cache.
+    """
+
+    def __init__(self, cpu):
+        self.cpu = cpu
+        self.blocks = {}
+        self.templates = {}
+        self.ram_blocks = {}
+        self.code_map = bytearray(0x10000)
+        # Inlined handler bodies resolve names (ALU tables, flag masks, ...) in the modules they were written in
+        self.handler_globals = {}
+        for klass in reversed(type(cpu).__mro__):
+            self.handler_globals.update(vars(sys.modules[klass.__module__]))
+
+    def block_key(self, address):
+        if address >= RAM_START:
+            if EXTERNAL_RAM[0] <= address < EXTERNAL_RAM[1]:
+                cartridge = self.cpu.motherboard.cartridge
+                return address, cartridge.ram_bank if cartridge.ram_enabled else RAM_DISABLED_BANK
+            return address, 0
+        motherboard = self.cpu.motherboard
+        if address < 0x100 and motherboard.boot_rom_mapped:
+            # Boot ROM code, its own "bank" so nothing compiled from it outlives the unmap
+            return address, BOOT_BANK
+        cartridge = motherboard.cartridge
+        return address, cartridge.rom_bank if address >= 0x4000 else cartridge.rom_bank0
+
+    def lookup(self, address):
+        key = self.block_key(address)
+        block = self.blocks.get(key)
+        if block is None:
+            block = self.compile(address)
+            self.blocks[key] = block
+
+        return block
+
+    def invalidate(self, address):
+        """
+        Drops every RAM block covering `address`, called when that byte is overwritten.
+        """
+        stale = [key for key, (start, end) in self.ram_blocks.items() if start <= address < end]
+        for key in stale:
+            start, end = self.ram_blocks.pop(key)
+            self.blocks.pop(key, None)
+            self.code_map[start:end] = bytes(end - start)
+            logging.debug(f"Invalidated block at {start:04X}")
+
+        # Blocks can overlap, re-mark whatever survived
+        for start, end in self.ram_blocks.values():
+            self.code_map[start:end] = b'\x01' * (end - start)
+
+    def clear(self):
+        self.blocks.clear()
+        self.ram_blocks.clear()
+        self.code_map[:] = bytes(0x10000)
+
+    # === Decoding ===
+    def decode(self, address):
+        """
+        :return: (dispatch index, operand value or None, instruction length)
+        """
+        # Not through the CPU: a block first compiled during OAM DMA would cache the lockout's 0xFF bytes
+        fetch = self.cpu.mmu.peek
+        index = fetch(address)
+        if index == 0xCB:
+            return 0x100 + fetch((address + 1) & 0xFFFF), None, 2
+
+        _, operand_length, _ = self.cpu.dispatch_table[index]
+        if operand_length == 0:
+            return index, None, 1
+        if operand_length == 1:
+            return index, fetch((address + 1) & 0xFFFF), 2
+
+        value = (fetch((address + 2) & 0xFFFF) << 8) + fetch((address + 1) & 0xFFFF)
+        return index, value, 3
+
+    def opcode_info(self, index):
+        if index >= 0x100:
+            return self.cpu.opcodes['cbprefixed'][f"0x{index - 0x100:02X}"]
+        return self.cpu.opcodes['unprefixed'][f"0x{index:02X}"]
+
+    def template(self, fn):
+        """
+        Parses a handler once and splits it into (statements, cycles), or None if it can't be inlined.
+        """
+        name = getattr(fn, '__name__', None)
+        if name in self.templates:
+            return self.templates[name]
+
+        template = None
+        method = getattr(type(self.cpu), name, None) if name else None
+        if method is not None:
+            tree = ast.parse(textwrap.dedent(inspect.getsource(method)))
+            template = self.split_handler(tree.body[0])
+
+        self.templates[name] = template
+        return template
+
+    @staticmethod
+    def split_handler(fn_def):
+        body = list(fn_def.body)
+        cycles = None
+        if body and isinstance(body[-1], ast.Return):
+            returned = body.pop().value
+            if not isinstance(returned, ast.Constant):
+                return None
+            cycles = returned.value
+
+        statements = [stmt for stmt in body if not is_pc_step(stmt)]
+        for stmt in statements:
+            for node in ast.walk(stmt):
+                # Early returns are branches, and anything still touching PC needs the real PC
+                if isinstance(node, ast.Return) or is_pc_access(node):
+                    return None
+
+        return statements, cycles
+
+    # === Compilation ===
+    def compile(self, start):
+        statements = []
+        namespace = dict(self.handler_globals)
+        namespace['scheduler'] = self.cpu.motherboard.scheduler
+        cycles = 0
+        # Cycles already added to scheduler.cycles
+        published = 0
+        address = start
+        closed = False
+
+        for _ in range(MAX_BLOCK_LENGTH):
+            index, value, length = self.decode(address)
+            fn, _, base_cycles = self.cpu.dispatch_table[index]
+            mnemonic = self.opcode_info(index)['mnemonic']
+            template = None if mnemonic in TERMINATORS else self.template(fn)
+
+            if template is None:
+                # Close the block with a real handler call
+                handler = f"handler_{address:04X}"
+                namespace[handler] = fn
+                args = '' if value is None else str(value)
+                if cycles > published:
+                    statements.append(publish_clock(cycles - published))
+                statements.extend(ast.parse(
+                    f"self.PC = {address}\n"
+                    f"cycles = {handler}({args})\n"
+                    f"self.PC &= 0xFFFF\n"
+                    f"return {cycles} + (cycles or {base_cycles})\n"
+                ).body)
+                address = (address + length) & 0xFFFF
+                closed = True
+                break
+
+            body, handler_cycles = template
+            if cycles > published and touches_memory(body):
+                statements.append(publish_clock(cycles - published))
+                published = cycles
+            statements.extend(substitute_value(stmt, value) for stmt in body)
+            cycles += handler_cycles or base_cycles
+            address = (address + length) & 0xFFFF
+
+            # Keep each block inside one memory region so a bank switch can't leave it half stale
+            if address >> 14 != start >> 14:
+                break
+
+        if not closed:
+            statements.extend(ast.parse(f"self.PC = {address}\nreturn {cycles}\n").body)
+
+        bank = self.block_key(start)[1]
+        label = BANK_LABELS.get(bank) or f"{bank:02X}"
+        name = f"block_{label}_{start:04X}"
+        body = '\n'.join(ast.unparse(ast.fix_missing_locations(stmt)) for stmt in statements)
+        source = f"def {name}(self):\n{textwrap.indent(body, '    ')}\n"
+        exec(compile(source, f"<block {label}:{start:04X}>", 'exec'), namespace)
+
+        block = namespace[name]
+        block.source = source
+        logging.debug(f"Compiled block {label}:{start:04X}\n{source}")
+
+        if start >= RAM_START:
+            end = address if address > start else 0x10000
+            self.ram_blocks[(start, bank)] = (start, end)
+            self.code_map[start:end] = b'\x01' * (end - start)
+
+        return block
+
+
+def publish_clock(cycles):
+    return ast.parse(f"scheduler.cycles += {cycles}").body[0]
+
+
+def touches_memory(statements):
+    return any(isinstance(node, ast.Attribute) and node.attr in ('fetch_memory_address', 'set_memory_address')
+               for stmt in statements for node in ast.walk(stmt))
+
+
+def is_pc_step(stmt):
+    # self.PC += n / self.PC &= 0xFFFF, folded into one assignment at the end of the block
+    return (isinstance(stmt, ast.AugAssign) and is_pc_access(stmt.target)
+            and isinstance(stmt.value, ast.Constant))
+
+
+def is_pc_access(node):
+    return (isinstance(node, ast.Attribute) and node.attr == 'PC'
+            and isinstance(node.value, ast.Name) and node.value.id == 'self')
+
+
+class ValueSubstitution(ast.NodeTransformer):
+    def __init__(self, value):
+        self.value = value
+
+    def visit_Name(self, node):
+        if node.id == 'value':
+            return ast.copy_location(ast.Constant(self.value), node)
+        return node
+
+
+def substitute_value(stmt, value):
+    stmt = copy.deepcopy(stmt)
+    if value is None:
+        return stmt
+    return ValueSubstitution(value).visit(stmt)
@@ -0,0 +1,217 @@
+import logging
+import sys
+
+logging.basicConfig(stream=sys.stdout,
+                    level=logging.INFO,
+                    format='[%(asctime)s] {%(filename)s:%(lineno)d} %(levelname)s - %(message)s')
+
+ROM_BANK_SIZE = 0x4000
+RAM_BANK_SIZE = 0x2000
+
+CARTRIDGE_TYPE = 0x147
+HEADER_END = 0x150
+RAM_SIZE = 0x149
+
+# Header byte 0x149 -> external RAM size
+RAM_SIZES = {0x00: 0, 0x01: 0x800, 0x02: 0x2000, 0x03: 0x8000, 0x04: 0x20000, 0x05: 0x10000}
+
+
+class Cartridge:
+    """
+    ROM only cartridge, the base for the memory bank controllers.
+
+    The ROM image is never copied: it is cut once into one ``memoryview`` per 16 KiB bank, and a bank
+    switch just points the MMU's 0x4000-0x7FFF pages at another view. External RAM banks work the same
+    way over one ``bytearray``. Bank 0 stays in the flat memory the boot ROM is overlaid on.
+    """
+
+    def __init__(self, rom, mmu):
+        # Kept to be closed with the cartridge when it is a mapping (utils.map_file)
+        self.image = rom
+        if len(rom) % (2 * ROM_BANK_SIZE):
+            # Truncated or homebrew image, round it up to whole banks
+            rom = bytes(rom) + bytes(-len(rom) % (2 * ROM_BANK_SIZE))
+
+        self.rom = memoryview(rom)
+        self.mmu = mmu
+        self.rom_banks = [self.rom[start:start + ROM_BANK_SIZE] for start in range(0, len(rom), ROM_BANK_SIZE)]
+
+        ram_size = RAM_SIZES.get(rom[RAM_SIZE], 0)
+        # A 2 KiB chip still answers the whole 8 KiB window
+        self.ram = bytearray(max(ram_size, RAM_BANK_SIZE) if ram_size else 0)
+        ram = memoryview(self.ram)
+        self.ram_banks = [ram[start:start + RAM_BANK_SIZE] for start in range(0, len(self.ram), RAM_BANK_SIZE)]
+
+        # Bank mapped at 0x0000-0x3FFF (only MBC1 moves it) and 0x4000-0x7FFF
+        self.rom_bank0 = 0
+        self.rom_bank = 1
+        self.ram_bank = 0
+        self.ram_enabled = False
+
+        mmu.map_write_handler(0x0000, 0x8000, self.write_control)
+        self.map_rom()
+        self.map_ram()
+
+    def close(self):
+        """
+        Releases the bank views and closes the ROM image if it is a file mapping. The MMU can't read
+        ROM afterwards.
+        """
+        for bank in self.rom_banks:
+            bank.release()
+        self.rom.release()
+        if hasattr(self.image, 'close'):
+            self.image.close()
+
+    @property
+    def title(self):
+        return bytes(self.rom[0x134:0x144]).split(b'\x00')[0].decode('ascii', 'replace')
+
+    def write_control(self, address, value):
+        logging.debug(f"Ignored write to ROM: {address:04X} = {value:02X}")
+
+    def map_rom(self):
+        # Read side only, writes to ROM stay controller commands
+        self.rom_bank %= len(self.rom_banks)
+        self.mmu.map_buffer(0x4000, 0x8000, self.rom_banks[self.rom_bank], write=False)
+
+    def map_rom0(self):
+        self.rom_bank0 %= len(self.rom_banks)
+        if self.rom_bank0:
+            self.mmu.map_buffer(0x0000, 0x4000, self.rom_banks[self.rom_bank0], write=False)
+        else:
+            self.mmu.map_buffer(0x0000, 0x4000, self.mmu.memory, 0, write=False)
+
+    def map_ram(self):
+        if self.ram_enabled and self.ram_banks:
+            self.ram_bank %= len(self.ram_banks)
+            self.mmu.map_buffer(0xA000, 0xC000, self.ram_banks[self.ram_bank])
+        else:
+            self.mmu.map_read_handler(0xA000, 0xC000, self.read_disabled)
+            self.mmu.map_write_handler(0xA000, 0xC000, self.write_disabled)
+
+    @staticmethod
+    def read_disabled(address):
+        # Open bus
+        return 0xFF
+
+    @staticmethod
+    def write_disabled(address, value):
+        pass
+
+
+class MBC1(Cartridge):
+    def __init__(self, rom, mmu):
+        self.lower_bank = 1
+        self.upper_bank = 0
+        self.banking_mode = 0
+        super().__init__(rom, mmu)
+
+    def write_control(self, address, value):
+        if address < 0x2000:
+            self.ram_enabled = value & 0x0F == 0x0A
+            self.map_ram()
+        elif address < 0x4000:
+            # Bank 0 can't be selected here, it reads as bank 1 (and 0x20/0x40/0x60 as 0x21/0x41/0x61)
+            self.lower_bank = (value & 0x1F) or 1
+            self.rom_bank = (self.upper_bank << 5) | self.lower_bank
+            self.map_rom()
+        elif address < 0x6000:
+            self.upper_bank = value & 0x03
+            self.rom_bank = (self.upper_bank << 5) | self.lower_bank
+            self.map_rom()
+            self.update_mode()
+        else:
+            self.banking_mode = value & 0x01
+            self.update_mode()
+
+    def update_mode(self):
+        # Mode 1 applies the upper bits to 0x0000-0x3FFF and to the RAM bank as well
+        upper = self.upper_bank if self.banking_mode else 0
+        self.rom_bank0 = upper << 5
+        self.map_rom0()
+        self.ram_bank = upper
+        self.map_ram()
+
+
+class MBC3(Cartridge):
+    """
+    The RTC registers are readable and writable but the clock doesn't run.
+    """
+
+    def __init__(self, rom, mmu):
+        self.rtc = bytearray(5)  # Seconds, minutes, hours, day low, day high/flags
+        self.rtc_select = None
+        super().__init__(rom, mmu)
+
+    def write_control(self, address, value):
+        if address < 0x2000:
+            self.ram_enabled = value & 0x0F == 0x0A
+            self.map_ram()
+        elif address < 0x4000:
+            self.rom_bank = (value & 0x7F) or 1
+            self.map_rom()
+        elif address < 0x6000:
+            if 0x08 <= value <= 0x0C:
+                self.rtc_select = value - 0x08
+            else:
+                self.rtc_select = None
+                self.ram_bank = value & 0x03
+            self.map_ram()
+        # 0x6000-0x7FFF latches the clock, there is nothing to latch
+
+    def map_ram(self):
+        if self.ram_enabled and self.rtc_select is not None:
+            self.mmu.map_read_handler(0xA000, 0xC000, self.read_rtc)
+            self.mmu.map_write_handler(0xA000, 0xC000, self.write_rtc)
+        else:
+            super().map_ram()
+
+    def read_rtc(self, address):
+        return self.rtc[self.rtc_select]
+
+    def write_rtc(self, address, value):
+        self.rtc[self.rtc_select] = value
+
+
+class MBC5(Cartridge):
+    def write_control(self, address, value):
+        if address < 0x2000:
+            self.ram_enabled = value & 0x0F == 0x0A
+            self.map_ram()
+        elif address < 0x3000:
+            # Unlike MBC1/3, bank 0 is a valid selection
+            self.rom_bank = (self.rom_bank & 0x100) | value
+            self.map_rom()
+        elif address < 0x4000:
+            self.rom_bank = ((value & 0x01) << 8) | (self.rom_bank & 0xFF)
+            self.map_rom()
+        elif address < 0x6000:
+            self.ram_bank = value & 0x0F
+            self.map_ram()
+
+
+# Header byte 0x147 -> controller
+CARTRIDGE_TYPES = {
+    0x00: Cartridge, 0x08: Cartridge, 0x09: Cartridge,
+    0x01: MBC1, 0x02: MBC1, 0x03: MBC1,
+    0x0F: MBC3, 0x10: MBC3, 0x11: MBC3, 0x12: MBC3, 0x13: MBC3,
+    0x19: MBC5, 0x1A: MBC5, 0x1B: MBC5, 0x1C: MBC5, 0x1D: MBC5, 0x1E: MBC5,
+}
+
+
+def load_cartridge(rom, mmu) -> Cartridge:
+    """
+    Picks the controller from the cartridge type in the header.
+    """
+    if len(rom) < HEADER_END:
+        raise ValueError(f"Not a Game Boy ROM: {len(rom)} bytes, too short for a cartridge header")
+
+    cartridge_type = rom[CARTRIDGE_TYPE]
+    cartridge_class = CARTRIDGE_TYPES.get(cartridge_type)
+    if cartridge_class is None:
+        logging.warning(f"Unsupported cartridge type {cartridge_type:02X}, running it as ROM only")
+        cartridge_class = Cartridge
+
+    logging.info(f"Cartridge type {cartridge_type:02X}: {cartridge_class.__name__}")
+    return cartridge_class(rom, mmu)
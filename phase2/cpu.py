@@ -1,11 +1,14 @@
 import json
 import logging
+import struct
 import sys
-import inspect
-from typing import Dict
 
+from phase2.alu import (FLAG_Z, FLAG_H, FLAG_C, CARRY_16, CARRY_8, ADC_TABLE, SBC_TABLE, AND_FLAGS, OR_FLAGS,
+                        INC_TABLE, DEC_TABLE, RLC_TABLE, RRC_TABLE, RL_TABLE, RR_TABLE, SLA_TABLE, SRA_TABLE,
+                        SRL_TABLE, SWAP_TABLE, DAA_TABLE)
+from phase2.block_compiler import BlockCompiler
+from phase2.idle_loop import IdleLoopDetector
 from phase2.motherboard import Motherboard
-from utils import shift_left, shift_right
 
 logging.basicConfig(stream=sys.stdout,
                     level=logging.INFO,
@@ -14,222 +17,315 @@ logging.basicConfig(stream=sys.stdout,
 MIN_BYTE = 0x0000  # 0
 MAX_BYTE = 0x00FF  # 255
 
+CYCLES_PER_FRAME = 70224  # 154 scanlines * 456 T-cycles
+FRAME_RATE = 4194304 / CYCLES_PER_FRAME  # 59.73 Hz LCD refresh
+
+# A, F, B, C, D, E, HL, SP, PC
+REGISTER_LAYOUT = struct.Struct('>6B3H')
+
 
 class CPU:
-    def __init__(self, motherboard: Motherboard, tick_rate=4194304):
+    # Fixed attribute layout: no per-instance __dict__ and cheaper lookups in the handlers
+    __slots__ = ('A', 'F', 'B', 'C', 'D', 'E', 'HL', 'SP', 'PC',
+                 'interrupt_master_enable', 'halted',
+                 'motherboard', 'mmu', 'tick_rate', 'frame_overrun', 'halted_cycles',
+                 'opcodes', 'dispatch_table', 'compile_blocks', 'block_compiler', 'idle_loops')
+
+    def __init__(self, motherboard: Motherboard, tick_rate=4194304, compile_blocks: bool = False,
+                 skip_idle_loops: bool = False):
+        # 8-bit registers, H and L live in HL (see the pair views below)
         self.A = 0
         self.F = 0
         self.B = 0
         self.C = 0
         self.D = 0
         self.E = 0
-        self.H = 0
-        self.L = 0
+        self.HL = 0
         self.SP = 0
         self.PC = 0
 
-        self.reg_fns = {
-            'A': self.reg_a,
-            'F': self.reg_f,
-            'B': self.reg_b,
-            'C': self.reg_c,
-            'D': self.reg_d,
-            'E': self.reg_e,
-            'H': self.reg_h,
-            'L': self.reg_l,
-            'AF': self.reg_af,
-            'BC': self.reg_bc,
-            'DE': self.reg_de,
-            'HL': self.reg_hl
-        }
+        self.interrupt_master_enable = False
+        self.halted = False
 
         self.motherboard = motherboard
+        self.mmu = motherboard.mmu
         self.tick_rate = tick_rate
 
+        # How far the last frame ran past its budget
+        self.frame_overrun = 0
+        # T-cycles fast-forwarded while halted
+        self.halted_cycles = 0
+
         self.opcodes = self.load_opcodes()
-        self.register_values()
+        self.dispatch_table = self.build_dispatch_table()
+
+        # Block mode runs whole basic blocks as one compiled function instead of one handler per opcode
+        self.compile_blocks = compile_blocks
+        self.block_compiler = BlockCompiler(self)
+
+        motherboard.interrupts.attach(self)
+
+        # Busy-wait polling loops get skipped up to the next event, switched on per ROM
+        self.idle_loops = IdleLoopDetector(self) if skip_idle_loops else None
 
     def register_values(self):
-        return [self.reg_af, self.reg_bc, self.reg_de, self.reg_hl, self.PC, self.SP]
+        return [self.AF, self.BC, self.DE, self.HL, self.PC, self.SP]
+
+    def save_registers(self) -> bytes:
+        """
+        Packs every register into one 12 byte snapshot.
+        """
+        return REGISTER_LAYOUT.pack(self.A, self.F, self.B, self.C, self.D, self.E, self.HL, self.SP, self.PC)
+
+    def load_registers(self, state: bytes):
+        self.A, self.F, self.B, self.C, self.D, self.E, self.HL, self.SP, self.PC = REGISTER_LAYOUT.unpack(state)
 
     def print_register_values(self):
         print(f"A: {self.A}")
         print(f"F: {self.F}")
-        print(f"BC: {self.reg_bc}")
-        print(f"DE: {self.reg_de}")
-        print(f"HL: {self.reg_hl}")
+        print(f"BC: {self.BC}")
+        print(f"DE: {self.DE}")
+        print(f"HL: {self.HL}")
         print(f"PC: {self.PC}")
         print(f"SP: {self.SP}")
 
     def set_memory_address(self, address, value):
-        self.motherboard.set_byte(address, value)
+        self.mmu.write(address, value)
+        if self.block_compiler.code_map[address]:
+            # Code in RAM was overwritten, the compiled copy is stale
+            self.block_compiler.invalidate(address)
 
     def fetch_memory_address(self, address):
-        return self.motherboard.get_byte(address)
+        return self.mmu.read(address)
 
     def execute(self) -> int:
         """
+        Fetches the opcode at PC and dispatches it through the precomputed table.
 
         :return: cycles
         """
-        logging.info(f"Get PC instruction: {self.PC}")
-        instruction = self.fetch_memory_address(self.PC)
-        logging.info(f"decoded instruction: {instruction}")
-
-        try:
-            instruction = f"{instruction}".replace('\'', '').replace('b\\', '0')
-            print(instruction)
-            instruction = f"{instruction[:2]}{instruction[2].upper()}{instruction[3].upper()}"
-            logging.info(f"current Instruction: {instruction}")
-
-            #  This tell us which instruction table to get stuff from
-            try:
-                if instruction == '0xCB':
-                    opcode = self.opcodes['prefixed'][instruction]
-                else:
-                    # opcode 0x00 is special in that it has no operands. Perhaps there is a better way to handle this
-                    if instruction == '0x00':
-                        self.PC += 1
-                        self.PC &= 0xFFFF
-                        return 4
-                    opcode = self.opcodes['unprefixed'][instruction]
-            except KeyError as e:
-                print(f"Opcode not found: {instruction}")
-                raise e
-
-            logging.info(f"Opcode: {opcode}")
-            return self.execute_opcode(instruction, opcode)
-        except Exception as ex:
-            logging.info(f"Weird byte: {instruction}")
-            # raise ex
-            self.PC += 1
+        if self.halted:
+            return 4
+
+        pc = self.PC
+        # Instruction bytes bypass the OAM DMA lockout, like the fast path's straight buffer reads
+        peek = self.mmu.peek
+        opcode = peek(pc)
+        if opcode == 0xCB:
+            opcode = 0x100 + peek((pc + 1) & 0xFFFF)
+
+        fn, operand_length, cycles = self.dispatch_table[opcode]
+
+        if operand_length == 0:
+            result = fn()
+        elif operand_length == 1:
+            result = fn(peek((pc + 1) & 0xFFFF))
+        else:
+            result = fn((peek((pc + 2) & 0xFFFF) << 8) + peek((pc + 1) & 0xFFFF))
 
-    def execute_opcode(self, instruction, opcode) -> int:
-        # Immediate: if true get from PC + 1, else from register
+        self.PC &= 0xFFFF
 
-        logging.debug(f"Executing opcode mnemonic: {opcode['mnemonic']}")
+        # Not every handler returns its cycles, fall back to the base count
+        return result or cycles
 
-        func_name = f"{opcode['mnemonic']}_{instruction[:-2]}"
-        fn = self.__getattribute__(func_name)
+    def run_cycles(self, budget: int) -> int:
+        """
+        Executes instructions until at least `budget` T-cycles have elapsed.
+        The dispatch table and memory stay in locals for the whole run; the only per-instruction
+        bookkeeping is publishing the clock and comparing it against the scheduler's next deadline.
 
-        # # 1st byte is current byte
-        # # every other byte is read
-        _bytes = opcode['bytes']
+        :return: exact cycles consumed, can overshoot `budget` by the last instruction
+        """
+        scheduler = self.motherboard.scheduler
+        idle_loops = self.idle_loops
+        start = now = scheduler.cycles
+        end = start + budget
+
+        if self.compile_blocks:
+            lookup = self.block_compiler.lookup
+            while now < end:
+                if self.halted:
+                    now += self.skip_halt(end - now, now)
+                else:
+                    pc = self.PC
+                    now += lookup(pc)(self)
+                    if idle_loops is not None and self.PC == pc:
+                        # The block jumped back to its own start
+                        now += idle_loops.skip(pc, now, end - now)
+
+                scheduler.cycles = now
+                if now >= scheduler.deadline:
+                    scheduler.run_due()
+                    # Events can take time of their own (interrupt dispatch)
+                    now = scheduler.cycles
+        else:
+            # Instructions are fetched straight from the page backing PC (ROM bank, WRAM, ...)
+            buffers = self.mmu.read_buffers
+            bases = self.mmu.read_bases
+            table = self.dispatch_table
+            while now < end:
+                if self.halted:
+                    now += self.skip_halt(end - now, now)
+                else:
+                    pc = self.PC
+                    page = pc >> 8
+                    memory = buffers[page]
+                    if memory is None or pc & 0xFF > 0xFD:
+                        # Handler page (HRAM) or an instruction running into the next page
+                        now += self.execute()
+                    else:
+                        offset = pc - bases[page]
+                        opcode = memory[offset]
+                        if opcode == 0xCB:
+                            opcode = 0x100 + memory[offset + 1]
+
+                        fn, operand_length, base_cycles = table[opcode]
+                        if operand_length == 0:
+                            result = fn()
+                        elif operand_length == 1:
+                            result = fn(memory[offset + 1])
+                        else:
+                            result = fn((memory[offset + 2] << 8) + memory[offset + 1])
 
-        arg = 0
-        if _bytes == 3:
-            a = self.fetch_memory_address(self.PC + 2)
-            b = self.fetch_memory_address(self.PC + 1)
-            arg = (a << 8) + b
-        elif _bytes == 2:
-            arg = self.fetch_memory_address(self.PC + 1)
+                        self.PC &= 0xFFFF
+                        now += result or base_cycles
 
-        if len(inspect.getfullargspec(func_name).args) > 0:
-            cycles = fn()
-        else:
-            cycles = fn(arg)
+                    if idle_loops is not None and self.PC < pc:
+                        now += idle_loops.skip(self.PC, now, end - now, pc)
 
-        self.PC &= 0xFFFF
+                scheduler.cycles = now
+                if now >= scheduler.deadline:
+                    scheduler.run_due()
+                    # Events can take time of their own (interrupt dispatch)
+                    now = scheduler.cycles
 
-        # I didn't return this on all items
-        return cycles or opcode['cycles'][0]
+        return now - start
 
-    def load_opcodes(self):
-        with open('opcodes/Opcodes.json') as json_file:
-            data = json.load(json_file)
+    def skip_halt(self, remaining: int, now: int) -> int:
+        """
+        Fast-forwards a halted CPU straight to the next scheduled event (timer, LCD, joypad)
+        instead of idling 4 cycles at a time. With nothing scheduled the rest of the budget is skipped.
 
-        return data
+        :return: cycles skipped
+        """
+        skipped = min(remaining, max(self.motherboard.scheduler.deadline - now, 4))
+        self.halted_cycles += skipped
+        return skipped
 
-    # === Register items ===
     @property
-    def reg_a(self):
-        return f"{self.A}"
-
-    @reg_a.setter
-    def reg_a(self, val):
-        self.A = val
+    def cycles(self):
+        # Total T-cycles executed, the clock itself lives in the scheduler
+        return self.motherboard.scheduler.cycles
 
     @property
-    def reg_b(self):
-        return f"{self.B}"
+    def frame_budget(self):
+        # T-cycles in 1/59.73 s at tick_rate (CYCLES_PER_FRAME at 4.194304 MHz), less the last overshoot
+        return round(self.tick_rate / FRAME_RATE) - self.frame_overrun
+
+    def run_frame(self) -> int:
+        """
+        Runs one frame worth of T-cycles at `tick_rate`. Overshoot from the previous frame is taken
+        off this frame's budget so frames average out to exactly tick_rate / FRAME_RATE.
 
-    @reg_b.setter
-    def reg_b(self, val):
-        self.B = val
+        :return: cycles consumed
+        """
+        budget = self.frame_budget
+        cycles = self.run_cycles(budget)
+        self.frame_overrun = cycles - budget
+        return cycles
 
-    @property
-    def reg_c(self):
-        return f"{self.C}"
+    def execute_block(self) -> int:
+        """
+        Runs the compiled basic block starting at PC, compiling it on first use.
 
-    @reg_c.setter
-    def reg_c(self, val):
-        self.C = val
+        :return: cycles of the whole block
+        """
+        return self.block_compiler.lookup(self.PC)(self)
 
-    @property
-    def reg_d(self):
-        return f"{self.D}"
+    def build_dispatch_table(self):
+        """
+        Builds the 512 handler slots once: 0x000-0x0FF unprefixed, 0x100-0x1FF CB-prefixed.
+        Every slot is a tuple of (bound method, operand length, base cycles).
+        """
+        table = [None] * 0x200
 
-    @reg_d.setter
-    def reg_d(self, val):
-        self.D = val
+        for key, opcode in self.opcodes['unprefixed'].items():
+            index = int(key, 16)
+            name = f"{opcode['mnemonic']}_{index:02X}"
+            table[index] = self.dispatch_entry(name, opcode, opcode['bytes'] - 1)
 
-    @property
-    def reg_e(self):
-        return f"{self.E}"
+        for key, opcode in self.opcodes['cbprefixed'].items():
+            index = 0x100 + int(key, 16)
+            # The prefixed handlers have no operands, they step PC over the CB byte themselves
+            name = f"{opcode['mnemonic']}_{index:X}"
+            table[index] = self.dispatch_entry(name, opcode, 0)
 
-    @reg_e.setter
-    def reg_e(self, val):
-        self.E = val
+        return table
 
-    @property
-    def reg_f(self):
-        return f"{self.F}"
+    def dispatch_entry(self, name, opcode, operand_length):
+        fn = getattr(self, name, None)
+        if fn is None:
+            fn = self.unimplemented_opcode(name, opcode['bytes'])
+            operand_length = 0
 
-    @reg_f.setter
-    def reg_f(self, val):
-        self.F = val
+        return fn, operand_length, opcode['cycles'][0]
 
-    @property
-    def reg_h(self):
-        return f"{self.H}"
+    def unimplemented_opcode(self, name, length):
+        def handler():
+            logging.warning(f"Opcode not implemented: {name}")
+            self.PC += length
 
-    @reg_h.setter
-    def reg_h(self, val):
-        self.H = val
+        return handler
 
-    @property
-    def reg_l(self):
-        return f"{self.L}"
+    def load_opcodes(self):
+        with open('opcodes/Opcodes.json') as json_file:
+            data = json.load(json_file)
 
-    @reg_l.setter
-    def reg_l(self, val):
-        self.L = val
+        return data
 
+    # === Register pairs ===
     @property
-    def reg_af(self):
-        return f"{self.A}{self.F}"
+    def AF(self):
+        return (self.A << 8) | self.F
+
+    @AF.setter
+    def AF(self, val):
+        self.A = (val >> 8) & MAX_BYTE
+        self.F = val & 0xF0
 
     @property
-    def reg_bc(self):
-        return f"{self.B}{self.C}"
+    def BC(self):
+        return (self.B << 8) | self.C
 
-    @reg_bc.setter
-    def reg_bc(self, val):
-        self.B = shift_right(val)
+    @BC.setter
+    def BC(self, val):
+        self.B = (val >> 8) & MAX_BYTE
         self.C = val & MAX_BYTE
 
     @property
-    def reg_de(self):
-        return f"{self.D}{self.E}"
+    def DE(self):
+        return (self.D << 8) | self.E
 
-    @reg_de.setter
-    def reg_de(self, val):
-        self.B = shift_right(val)
-        self.C = val & MAX_BYTE
+    @DE.setter
+    def DE(self, val):
+        self.D = (val >> 8) & MAX_BYTE
+        self.E = val & MAX_BYTE
+
+    @property
+    def H(self):
+        return self.HL >> 8
+
+    @H.setter
+    def H(self, val):
+        self.HL = (self.HL & 0x00FF) | (val << 8)
 
     @property
-    def reg_hl(self):
-        return f"{self.H}{self.L}"
+    def L(self):
+        return self.HL & MAX_BYTE
+
+    @L.setter
+    def L(self, val):
+        self.HL = (self.HL & 0xFF00) | val
 
     # === Flags ===
     @property
@@ -290,7 +386,7 @@ class CPU:
         return 4
 
     def LD_01(self, value):  # 01 LD BC,d16
-        self.reg_bc(value)
+        self.BC = value
         self.PC += 3
 
     def LD_02(self):  # 02 LD (BC),A
@@ -301,45 +397,33 @@ class CPU:
         temp = ((self.B << 8) + self.C) + 1
         # No flag operations
         temp &= 0xFFFF
-        self.reg_bc(temp)
+        self.BC = temp
         self.PC += 1
 
     def INC_04(self):  # 04 INC B
-        temp = self.B + 1
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.B & 0xF) + (1 & 0xF)) > 0xF) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-
-        self.B = temp
+        temp = INC_TABLE[self.B]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.B = temp >> 8
         self.PC += 1
+        return 4
 
     def DEC_05(self):  # 05 DEC B
-        temp = self.B - 1
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.B & 0xF) - (1 & 0xF)) < 0) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-        self.B = temp
+        temp = DEC_TABLE[self.B]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.B = temp >> 8
         self.PC += 1
+        return 4
 
     def LD_06(self, value):  # 06 LD B,d8
         self.B = value
         self.PC += 2
 
     def RLCA_07(self):  # 07 RLCA
-        temp = (self.A << 1) + (self.A >> 7)
-        flag = 0b00000000
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = RLC_TABLE[self.A]
+        self.A = temp >> 8
+        self.F = temp & FLAG_C
         self.PC += 1
+        return 4
 
     def LD_08(self, value):  # 08 LD (a16),SP
         self.set_memory_address(value, self.SP & 0xFF)
@@ -349,8 +433,8 @@ class CPU:
     def ADD_09(self):  # 09 ADD HL,BC
         temp = self.HL + ((self.B << 8) + self.C)
         flag = 0b00000000
-        flag += (((self.HL & 0xFFF) + (((self.B << 8) + self.C) & 0xFFF)) > 0xFFF) << self.h_flag
-        flag += (temp > 0xFFFF) << self.c_flag
+        flag += (((self.HL & 0xFFF) + (((self.B << 8) + self.C) & 0xFFF)) > 0xFFF) * FLAG_H
+        flag += (temp > 0xFFFF) * FLAG_C
         self.F &= 0b10000000
         self.F |= flag
         temp &= 0xFFFF
@@ -358,51 +442,40 @@ class CPU:
         self.PC += 1
 
     def LD_0A(self):  # 0A LD A,(BC)
-        self.A = self.set_memory_address(((self.B << 8) + self.C))
+        self.A = self.fetch_memory_address(((self.B << 8) + self.C))
         self.PC += 1
 
     def DEC_0B(self):  # 0B DEC BC
         temp = ((self.B << 8) + self.C) - 1
         # No flag operations
         temp &= 0xFFFF
-        self.reg_bc(temp)
+        self.BC = temp
         self.PC += 1
 
     def INC_0C(self):  # 0C INC C
-        temp = self.C + 1
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.C & 0xF) + (1 & 0xF)) > 0xF) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-        self.C = temp
+        temp = INC_TABLE[self.C]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.C = temp >> 8
         self.PC += 1
+        return 4
 
     def DEC_0D(self):  # 0D DEC C
-        temp = self.C - 1
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.C & 0xF) - (1 & 0xF)) < 0) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-        self.C = temp
+        temp = DEC_TABLE[self.C]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.C = temp >> 8
         self.PC += 1
+        return 4
 
     def LD_0E(self, value):  # 0E LD C,d8
         self.C = value
         self.PC += 2
 
     def RRCA_0F(self):  # 0F RRCA
-        temp = (self.A >> 1) + ((self.A & 1) << 7) + ((self.A & 1) << 8)
-        flag = 0b00000000
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = RRC_TABLE[self.A]
+        self.A = temp >> 8
+        self.F = temp & FLAG_C
         self.PC += 1
+        return 4
 
     # def STOP_10(self, value):  # 10 STOP 0
     #     if self.mb.cgb:
@@ -413,7 +486,7 @@ class CPU:
     #     return 4
 
     def LD_11(self, value):  # 11 LD DE,d16
-        self.set_de(value)
+        self.DE = value
         self.PC += 3
 
     def LD_12(self):  # 12 LD (DE),A
@@ -424,44 +497,33 @@ class CPU:
         temp = ((self.D << 8) + self.E) + 1
         # No flag operations
         temp &= 0xFFFF
-        self.reg_de(temp)
+        self.DE = temp
         self.PC += 1
 
     def INC_14(self):  # 14 INC D
-        temp = self.D + 1
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.D & 0xF) + (1 & 0xF)) > 0xF) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-        self.D = temp
+        temp = INC_TABLE[self.D]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.D = temp >> 8
         self.PC += 1
+        return 4
 
     def DEC_15(self):  # 15 DEC D
-        temp = self.D - 1
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.D & 0xF) - (1 & 0xF)) < 0) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-        self.D = temp
+        temp = DEC_TABLE[self.D]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.D = temp >> 8
         self.PC += 1
+        return 4
 
     def LD_16(self, value):  # 16 LD D,d8
         self.D = value
         self.PC += 2
 
     def RLA_17(self):  # 17 RLA
-        temp = (self.A << 1) + self.c_flag != 0
-        flag = 0b00000000
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = RL_TABLE[self.A | ((self.F & FLAG_C) << CARRY_8)]
+        self.A = temp >> 8
+        self.F = temp & FLAG_C
         self.PC += 1
+        return 4
 
     def JR_18(self, value):  # 18 JR r8
         self.PC += 2 + ((value ^ 0x80) - 0x80)
@@ -469,8 +531,8 @@ class CPU:
     def ADD_19(self):  # 19 ADD HL,DE
         temp = self.HL + ((self.D << 8) + self.E)
         flag = 0b00000000
-        flag += (((self.HL & 0xFFF) + (((self.D << 8) + self.E) & 0xFFF)) > 0xFFF) << self.h_flag
-        flag += (temp > 0xFFFF) << self.c_flag
+        flag += (((self.HL & 0xFFF) + (((self.D << 8) + self.E) & 0xFFF)) > 0xFFF) * FLAG_H
+        flag += (temp > 0xFFFF) * FLAG_C
         self.F &= 0b10000000
         self.F |= flag
         temp &= 0xFFFF
@@ -478,55 +540,44 @@ class CPU:
         self.PC += 1
 
     def LD_1A(self):  # 1A LD A,(DE)
-        self.A = self.set_memory_address(((self.D << 8) + self.E))
+        self.A = self.fetch_memory_address(((self.D << 8) + self.E))
         self.PC += 1
 
     def DEC_1B(self):  # 1B DEC DE
         temp = ((self.D << 8) + self.E) - 1
         # No flag operations
         temp &= 0xFFFF
-        self.reg_de(temp)
+        self.DE = temp
         self.PC += 1
 
     def INC_1C(self):  # 1C INC E
-        temp = self.E + 1
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.E & 0xF) + (1 & 0xF)) > 0xF) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-        self.E = temp
+        temp = INC_TABLE[self.E]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.E = temp >> 8
         self.PC += 1
+        return 4
 
     def DEC_1D(self):  # 1D DEC E
-        temp = self.E - 1
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.E & 0xF) - (1 & 0xF)) < 0) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-        self.E = temp
+        temp = DEC_TABLE[self.E]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.E = temp >> 8
         self.PC += 1
+        return 4
 
     def LD_1E(self, value):  # 1E LD E,d8
         self.E = value
         self.PC += 2
 
     def RRA_1F(self):  # 1F RRA
-        temp = (self.A >> 1) + (self.c_flag != 0 << 7) + ((self.A & 1) << 8)
-        flag = 0b00000000
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = RR_TABLE[self.A | ((self.F & FLAG_C) << CARRY_8)]
+        self.A = temp >> 8
+        self.F = temp & FLAG_C
         self.PC += 1
+        return 4
 
     def JR_20(self, value):  # 20 JR NZ,r8
         self.PC += 2
-        if self.F & (1 << self.z_flag) == 0:
+        if not self.F & FLAG_Z:
             self.PC += ((value ^ 0x80) - 0x80)
             self.PC &= 0xFFFF
             return 12
@@ -552,54 +603,33 @@ class CPU:
         self.PC += 1
 
     def INC_24(self):  # 24 INC H
-        temp = (self.HL >> 8) + 1
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += ((((self.HL >> 8) & 0xF) + (1 & 0xF)) > 0xF) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0x00FF) | (temp << 8)
+        temp = INC_TABLE[(self.HL >> 8)]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.HL = (self.HL & 0x00FF) | (temp & 0xFF00)
         self.PC += 1
+        return 4
 
     def DEC_25(self):  # 25 DEC H
-        temp = (self.HL >> 8) - 1
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += ((((self.HL >> 8) & 0xF) - (1 & 0xF)) < 0) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0x00FF) | (temp << 8)
+        temp = DEC_TABLE[(self.HL >> 8)]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.HL = (self.HL & 0x00FF) | (temp & 0xFF00)
         self.PC += 1
+        return 4
 
     def LD_26(self, value):  # 26 LD H,d8
         self.HL = (self.HL & 0x00FF) | (value << 8)
         self.PC += 2
 
     def DAA_27(self):  # 27 DAA
-        temp = self.A
-        corr = 0
-        corr |= 0x06 if self.h_flag != 0 else 0x00
-        corr |= 0x60 if self.c_flag != 0else 0x00
-        if self.n_flag != 0:
-            temp -= corr
-        else:
-            corr |= 0x06 if (temp & 0x0F) > 0x09 else 0x00
-            corr |= 0x60 if temp > 0x99 else 0x00
-            temp += corr
-        flag = 0
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (corr & 0x60 != 0) << self.c_flag
-        self.F &= 0b01000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = DAA_TABLE[((self.F & 0x70) << 4) | self.A]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
+        return 4
 
     def JR_28(self, value):  # 28 JR Z,r8
         self.PC += 2
-        if self.z_flag != 0:
+        if self.F & FLAG_Z:
             self.PC += ((value ^ 0x80) - 0x80)
             return 12
         else:
@@ -608,8 +638,8 @@ class CPU:
     def ADD_29(self):  # 29 ADD HL,HL
         temp = self.HL + self.HL
         flag = 0b00000000
-        flag += (((self.HL & 0xFFF) + (self.HL & 0xFFF)) > 0xFFF) << self.h_flag
-        flag += (temp > 0xFFFF) << self.c_flag
+        flag += (((self.HL & 0xFFF) + (self.HL & 0xFFF)) > 0xFFF) * FLAG_H
+        flag += (temp > 0xFFFF) * FLAG_C
         self.F &= 0b10000000
         self.F |= flag
         temp &= 0xFFFF
@@ -617,7 +647,7 @@ class CPU:
         self.PC += 1
 
     def LD_2A(self):  # 2A LD A,(HL+)
-        self.A = self.set_memory_address(self.HL)
+        self.A = self.fetch_memory_address(self.HL)
         self.HL += 1
         self.HL &= 0xFFFF
         self.PC += 1
@@ -630,26 +660,18 @@ class CPU:
         self.PC += 1
 
     def INC_2C(self):  # 2C INC L
-        temp = (self.HL & 0xFF) + 1
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += ((((self.HL & 0xFF) & 0xF) + (1 & 0xF)) > 0xF) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0xFF00) | (temp & 0xFF)
+        temp = INC_TABLE[(self.HL & 0xFF)]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.HL = (self.HL & 0xFF00) | (temp >> 8)
         self.PC += 1
+        return 4
 
     def DEC_2D(self):  # 2D DEC L
-        temp = (self.HL & 0xFF) - 1
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += ((((self.HL & 0xFF) & 0xF) - (1 & 0xF)) < 0) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0xFF00) | (temp & 0xFF)
+        temp = DEC_TABLE[(self.HL & 0xFF)]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.HL = (self.HL & 0xFF00) | (temp >> 8)
         self.PC += 1
+        return 4
 
     def LD_2E(self, value):  # 2E LD L,d8
         self.HL = (self.HL & 0xFF00) | (value & 0xFF)
@@ -664,7 +686,7 @@ class CPU:
 
     def JR_30(self, value):  # 30 JR NC,r8
         self.PC += 2
-        if self.c_flag == 0:
+        if not self.F & FLAG_C:
             self.PC += ((value ^ 0x80) - 0x80)
             return 12
         else:
@@ -688,26 +710,16 @@ class CPU:
         self.PC += 1
 
     def INC_34(self):  # 34 INC (HL)
-        temp = self.fetch_memory_address(self.HL) + 1
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.fetch_memory_address(self.HL) & 0xF) + (1 & 0xF)) > 0xF) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-        self.set_memory_address(self.HL, temp)
+        temp = INC_TABLE[self.fetch_memory_address(self.HL)]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.set_memory_address(self.HL, (temp >> 8))
         self.PC += 1
         return 12
 
     def DEC_35(self):  # 35 DEC (HL)
-        temp = self.fetch_memory_address(self.HL) - 1
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.fetch_memory_address(self.HL) & 0xF) - (1 & 0xF)) < 0) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-        self.set_memory_address(self.HL, temp)
+        temp = DEC_TABLE[self.fetch_memory_address(self.HL)]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.set_memory_address(self.HL, (temp >> 8))
         self.PC += 1
         return 12
 
@@ -725,7 +737,7 @@ class CPU:
 
     def JR_38(self, value):  # 38 JR C,r8
         self.PC += 2
-        if self.c_flag != 0:
+        if self.F & FLAG_C:
             self.PC += ((value ^ 0x80) - 0x80)
             self.PC &= 0xFFFF
             return 12
@@ -736,8 +748,8 @@ class CPU:
     def ADD_39(self):  # 39 ADD HL,SP
         temp = self.HL + self.SP
         flag = 0b00000000
-        flag += (((self.HL & 0xFFF) + (self.SP & 0xFFF)) > 0xFFF) << self.h_flag
-        flag += (temp > 0xFFFF) << self.c_flag
+        flag += (((self.HL & 0xFFF) + (self.SP & 0xFFF)) > 0xFFF) * FLAG_H
+        flag += (temp > 0xFFFF) * FLAG_C
         self.F &= 0b10000000
         self.F |= flag
         temp &= 0xFFFF
@@ -761,26 +773,16 @@ class CPU:
         return 8
 
     def INC_3C(self):  # 3C INC A
-        temp = self.A + 1
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + (1 & 0xF)) > 0xF) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = INC_TABLE[self.A]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.A = temp >> 8
         self.PC += 1
         return 4
 
     def DEC_3D(self):  # 3D DEC A
-        temp = self.A - 1
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (1 & 0xF)) < 0) << self.h_flag
-        self.F &= 0b00010000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = DEC_TABLE[self.A]
+        self.F = (self.F & FLAG_C) | (temp & 0xFF)
+        self.A = temp >> 8
         self.PC += 1
         return 4
 
@@ -1068,6 +1070,9 @@ class CPU:
 
     def HALT_76(self):  # 76 HALT
         self.halted = True
+        # Wakes straight back up if an interrupt is already pending
+        self.motherboard.interrupts.schedule_check()
+        self.PC += 1
         return 4
 
     def LD_77(self):  # 77 LD (HL),A
@@ -1116,783 +1121,423 @@ class CPU:
         return 4
 
     def ADD_80(self):  # 80 ADD A,B
-        temp = self.A + self.B
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + (self.B & 0xF)) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | self.B]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def ADD_81(self):  # 81 ADD A,C
-        temp = self.A + self.C
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + (self.C & 0xF)) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | self.C]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def ADD_82(self):  # 82 ADD A,D
-        temp = self.A + self.D
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + (self.D & 0xF)) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | self.D]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def ADD_83(self):  # 83 ADD A,E
-        temp = self.A + self.E
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + (self.E & 0xF)) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | self.E]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def ADD_84(self):  # 84 ADD A,H
-        temp = self.A + (self.HL >> 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + ((self.HL >> 8) & 0xF)) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | (self.HL >> 8)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def ADD_85(self):  # 85 ADD A,L
-        temp = self.A + (self.HL & 0xFF)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + ((self.HL & 0xFF) & 0xF)) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | (self.HL & 0xFF)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def ADD_86(self):  # 86 ADD A,(HL)
-        temp = self.A + self.fetch_memory_address(self.HL)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + (self.fetch_memory_address(self.HL) & 0xF)) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | self.fetch_memory_address(self.HL)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 8
 
     def ADD_87(self):  # 87 ADD A,A
-        temp = self.A + self.A
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + (self.A & 0xF)) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | self.A]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def ADC_88(self):  # 88 ADC A,B
-        temp = self.A + self.B + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + (self.B & 0xF) + self.c_flag != 0) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | self.B | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def ADC_89(self):  # 89 ADC A,C
-        temp = self.A + self.C + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + (self.C & 0xF) + self.c_flag != 0) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | self.C | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def ADC_8A(self):  # 8A ADC A,D
-        temp = self.A + self.D + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + (self.D & 0xF) + self.c_flag != 0) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | self.D | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def ADC_8B(self):  # 8B ADC A,E
-        temp = self.A + self.E + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + (self.E & 0xF) + self.c_flag != 0) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | self.E | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def ADC_8C(self):  # 8C ADC A,H
-        temp = self.A + (self.HL >> 8) + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + ((self.HL >> 8) & 0xF) + self.c_flag != 0) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | (self.HL >> 8) | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def ADC_8D(self):  # 8D ADC A,L
-        temp = self.A + (self.HL & 0xFF) + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + ((self.HL & 0xFF) & 0xF) + self.c_flag != 0) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | (self.HL & 0xFF) | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def ADC_8E(self):  # 8E ADC A,(HL)
-        temp = self.A + self.fetch_memory_address(self.HL) + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + (self.fetch_memory_address(self.HL) & 0xF) + self.c_flag != 0) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | self.fetch_memory_address(self.HL) | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 8
 
     def ADC_8F(self):  # 8F ADC A,A
-        temp = self.A + self.A + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + (self.A & 0xF) + self.c_flag != 0) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | self.A | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def SUB_90(self):  # 90 SUB B
-        temp = self.A - self.B
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.B & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | self.B]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def SUB_91(self):  # 91 SUB C
-        temp = self.A - self.C
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.C & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | self.C]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def SUB_92(self):  # 92 SUB D
-        temp = self.A - self.D
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.D & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | self.D]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def SUB_93(self):  # 93 SUB E
-        temp = self.A - self.E
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.E & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | self.E]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def SUB_94(self):  # 94 SUB H
-        temp = self.A - (self.HL >> 8)
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - ((self.HL >> 8) & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | (self.HL >> 8)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def SUB_95(self):  # 95 SUB L
-        temp = self.A - (self.HL & 0xFF)
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - ((self.HL & 0xFF) & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | (self.HL & 0xFF)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def SUB_96(self):  # 96 SUB (HL)
-        temp = self.A - self.fetch_memory_address(self.HL)
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.fetch_memory_address(self.HL) & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | self.fetch_memory_address(self.HL)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 8
 
     def SUB_97(self):  # 97 SUB A
-        temp = self.A - self.A
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.A & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | self.A]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def SBC_98(self):  # 98 SBC A,B
-        temp = self.A - self.B - self.c_flag != 0
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.B & 0xF) - self.c_flag != 0) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | self.B | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def SBC_99(self):  # 99 SBC A,C
-        temp = self.A - self.C - self.c_flag != 0
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.C & 0xF) - self.c_flag != 0) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | self.C | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def SBC_9A(self):  # 9A SBC A,D
-        temp = self.A - self.D - self.c_flag != 0
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.D & 0xF) - self.c_flag != 0) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | self.D | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def SBC_9B(self):  # 9B SBC A,E
-        temp = self.A - self.E - self.c_flag != 0
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.E & 0xF) - self.c_flag != 0) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | self.E | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def SBC_9C(self):  # 9C SBC A,H
-        temp = self.A - (self.HL >> 8) - self.c_flag != 0
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - ((self.HL >> 8) & 0xF) - self.c_flag != 0) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | (self.HL >> 8) | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def SBC_9D(self):  # 9D SBC A,L
-        temp = self.A - (self.HL & 0xFF) - self.c_flag != 0
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - ((self.HL & 0xFF) & 0xF) - self.c_flag != 0) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | (self.HL & 0xFF) | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def SBC_9E(self):  # 9E SBC A,(HL)
-        temp = self.A - self.fetch_memory_address(self.HL) - self.c_flag != 0
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.fetch_memory_address(self.HL) & 0xF) - self.c_flag != 0) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | self.fetch_memory_address(self.HL) | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 8
 
     def SBC_9F(self):  # 9F SBC A,A
-        temp = self.A - self.A - self.c_flag != 0
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.A & 0xF) - self.c_flag != 0) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | self.A | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def AND_A0(self):  # A0 AND B
-        temp = self.A & self.B
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A & self.B
+        self.F = AND_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def AND_A1(self):  # A1 AND C
-        temp = self.A & self.C
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A & self.C
+        self.F = AND_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def AND_A2(self):  # A2 AND D
-        temp = self.A & self.D
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A & self.D
+        self.F = AND_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def AND_A3(self):  # A3 AND E
-        temp = self.A & self.E
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A & self.E
+        self.F = AND_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def AND_A4(self):  # A4 AND H
-        temp = self.A & (self.HL >> 8)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A & (self.HL >> 8)
+        self.F = AND_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def AND_A5(self):  # A5 AND L
-        temp = self.A & (self.HL & 0xFF)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A & (self.HL & 0xFF)
+        self.F = AND_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def AND_A6(self):  # A6 AND (HL)
-        temp = self.A & self.fetch_memory_address(self.HL)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A & self.fetch_memory_address(self.HL)
+        self.F = AND_FLAGS[self.A]
         self.PC += 1
         return 8
 
     def AND_A7(self):  # A7 AND A
-        temp = self.A & self.A
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A & self.A
+        self.F = AND_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def XOR_A8(self):  # A8 XOR B
-        temp = self.A ^ self.B
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A ^ self.B
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def XOR_A9(self):  # A9 XOR C
-        temp = self.A ^ self.C
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A ^ self.C
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def XOR_AA(self):  # AA XOR D
-        temp = self.A ^ self.D
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A ^ self.D
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def XOR_AB(self):  # AB XOR E
-        temp = self.A ^ self.E
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A ^ self.E
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def XOR_AC(self):  # AC XOR H
-        temp = self.A ^ (self.HL >> 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A ^ (self.HL >> 8)
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def XOR_AD(self):  # AD XOR L
-        temp = self.A ^ (self.HL & 0xFF)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A ^ (self.HL & 0xFF)
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def XOR_AE(self):  # AE XOR (HL)
-        temp = self.A ^ self.fetch_memory_address(self.HL)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A ^ self.fetch_memory_address(self.HL)
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 8
 
     def XOR_AF(self):  # AF XOR A
-        temp = self.A ^ self.A
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A ^ self.A
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def OR_B0(self):  # B0 OR B
-        temp = self.A | self.B
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A | self.B
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def OR_B1(self):  # B1 OR C
-        temp = self.A | self.C
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A | self.C
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def OR_B2(self):  # B2 OR D
-        temp = self.A | self.D
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A | self.D
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def OR_B3(self):  # B3 OR E
-        temp = self.A | self.E
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A | self.E
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def OR_B4(self):  # B4 OR H
-        temp = self.A | (self.HL >> 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A | (self.HL >> 8)
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def OR_B5(self):  # B5 OR L
-        temp = self.A | (self.HL & 0xFF)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A | (self.HL & 0xFF)
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def OR_B6(self):  # B6 OR (HL)
-        temp = self.A | self.fetch_memory_address(self.HL)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A | self.fetch_memory_address(self.HL)
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 8
 
     def OR_B7(self):  # B7 OR A
-        temp = self.A | self.A
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A | self.A
+        self.F = OR_FLAGS[self.A]
         self.PC += 1
         return 4
 
     def CP_B8(self):  # B8 CP B
-        temp = self.A - self.B
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.B & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
+        temp = SBC_TABLE[(self.A << 8) | self.B]
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def CP_B9(self):  # B9 CP C
-        temp = self.A - self.C
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.C & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
+        temp = SBC_TABLE[(self.A << 8) | self.C]
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def CP_BA(self):  # BA CP D
-        temp = self.A - self.D
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.D & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
+        temp = SBC_TABLE[(self.A << 8) | self.D]
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def CP_BB(self):  # BB CP E
-        temp = self.A - self.E
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.E & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
+        temp = SBC_TABLE[(self.A << 8) | self.E]
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def CP_BC(self):  # BC CP H
-        temp = self.A - (self.HL >> 8)
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - ((self.HL >> 8) & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
+        temp = SBC_TABLE[(self.A << 8) | (self.HL >> 8)]
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def CP_BD(self):  # BD CP L
-        temp = self.A - (self.HL & 0xFF)
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - ((self.HL & 0xFF) & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
+        temp = SBC_TABLE[(self.A << 8) | (self.HL & 0xFF)]
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def CP_BE(self):  # BE CP (HL)
-        temp = self.A - self.fetch_memory_address(self.HL)
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.fetch_memory_address(self.HL) & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
+        temp = SBC_TABLE[(self.A << 8) | self.fetch_memory_address(self.HL)]
+        self.F = temp & 0xFF
         self.PC += 1
         return 8
 
     def CP_BF(self):  # BF CP A
-        temp = self.A - self.A
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (self.A & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
+        temp = SBC_TABLE[(self.A << 8) | self.A]
+        self.F = temp & 0xFF
         self.PC += 1
         return 4
 
     def RET_C0(self):  # C0 RET NZ
-        if self.f_nz():
+        if not self.F & FLAG_Z:
             self.PC = self.fetch_memory_address((self.SP + 1) & 0xFFFF) << 8  # High
             self.PC |= self.fetch_memory_address(self.SP)  # Low
             self.SP += 2
@@ -1912,7 +1557,7 @@ class CPU:
         return 12
 
     def JP_C2(self, value):  # C2 JP NZ,a16
-        if self.f_nz():
+        if not self.F & FLAG_Z:
             self.PC = value
             return 16
         else:
@@ -1926,7 +1571,7 @@ class CPU:
 
     def CALL_C4(self, value):  # C4 CALL NZ,a16
         self.PC += 3
-        if self.f_nz():
+        if not self.F & FLAG_Z:
             self.set_memory_address((self.SP - 1) & 0xFFFF, self.PC >> 8)  # High
             self.set_memory_address((self.SP - 2) & 0xFFFF, self.PC & 0xFF)  # Low
             self.SP -= 2
@@ -1945,15 +1590,9 @@ class CPU:
         return 16
 
     def ADD_C6(self, value):  # C6 ADD A,d8
-        temp = self.A + value
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + (value & 0xF)) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | value]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 2
         return 8
 
@@ -1967,7 +1606,7 @@ class CPU:
         return 16
 
     def RET_C8(self):  # C8 RET Z
-        if self.f_z():
+        if self.F & FLAG_Z:
             self.PC = self.fetch_memory_address((self.SP + 1) & 0xFFFF) << 8  # High
             self.PC |= self.fetch_memory_address(self.SP)  # Low
             self.SP += 2
@@ -1986,7 +1625,7 @@ class CPU:
         return 16
 
     def JP_CA(self, value):  # CA JP Z,a16
-        if self.f_z():
+        if self.F & FLAG_Z:
             self.PC = value
             return 16
         else:
@@ -2001,7 +1640,7 @@ class CPU:
 
     def CALL_CC(self, value):  # CC CALL Z,a16
         self.PC += 3
-        if self.f_z():
+        if self.F & FLAG_Z:
             self.set_memory_address((self.SP - 1) & 0xFFFF, self.PC >> 8)  # High
             self.set_memory_address((self.SP - 2) & 0xFFFF, self.PC & 0xFF)  # Low
             self.SP -= 2
@@ -2021,15 +1660,9 @@ class CPU:
         return 24
 
     def ADC_CE(self, value):  # CE ADC A,d8
-        temp = self.A + value + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) + (value & 0xF) + self.c_flag != 0) > 0xF) << self.h_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = ADC_TABLE[(self.A << 8) | value | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 2
         return 8
 
@@ -2043,7 +1676,7 @@ class CPU:
         return 16
 
     def RET_D0(self):  # D0 RET NC
-        if self.c_flag == 0:
+        if not self.F & FLAG_C:
             self.PC = self.fetch_memory_address((self.SP + 1) & 0xFFFF) << 8  # High
             self.PC |= self.fetch_memory_address(self.SP)  # Low
             self.SP += 2
@@ -2055,7 +1688,7 @@ class CPU:
             return 8
 
     def POP_D1(self):  # D1 POP DE
-        self.D = self.set_memory_address((self.SP + 1) & 0xFFFF)  # High
+        self.D = self.fetch_memory_address((self.SP + 1) & 0xFFFF)  # High
         self.E = self.fetch_memory_address(self.SP)  # Low
         self.SP += 2
         self.SP &= 0xFFFF
@@ -2063,7 +1696,7 @@ class CPU:
         return 12
 
     def JP_D2(self, value):  # D2 JP NC,a16
-        if self.c_flag == 0:
+        if not self.F & FLAG_C:
             self.PC = value
             return 16
         else:
@@ -2073,7 +1706,7 @@ class CPU:
 
     def CALL_D4(self, value):  # D4 CALL NC,a16
         self.PC += 3
-        if self.c_flag == 0:
+        if not self.F & FLAG_C:
             self.set_memory_address((self.SP - 1) & 0xFFFF, self.PC >> 8)  # High
             self.set_memory_address((self.SP - 2) & 0xFFFF, self.PC & 0xFF)  # Low
             self.SP -= 2
@@ -2092,15 +1725,9 @@ class CPU:
         return 16
 
     def SUB_D6(self, value):  # D6 SUB d8
-        temp = self.A - value
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (value & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | value]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 2
         return 8
 
@@ -2114,7 +1741,7 @@ class CPU:
         return 16
 
     def RET_D8(self):  # D8 RET C
-        if self.c_flag != 0:
+        if self.F & FLAG_C:
             self.PC = self.fetch_memory_address((self.SP + 1) & 0xFFFF) << 8  # High
             self.PC |= self.fetch_memory_address(self.SP)  # Low
             self.SP += 2
@@ -2126,15 +1753,15 @@ class CPU:
             return 8
 
     def RETI_D9(self):  # D9 RETI
-        self.interrupt_master_enable = True
         self.PC = self.fetch_memory_address((self.SP + 1) & 0xFFFF) << 8  # High
         self.PC |= self.fetch_memory_address(self.SP)  # Low
         self.SP += 2
         self.SP &= 0xFFFF
+        self.motherboard.interrupts.enable()
         return 16
 
     def JP_DA(self, value):  # DA JP C,a16
-        if self.c_flag != 0:
+        if self.F & FLAG_C:
             self.PC = value
             return 16
         else:
@@ -2144,7 +1771,7 @@ class CPU:
 
     def CALL_DC(self, value):  # DC CALL C,a16
         self.PC += 3
-        if self.c_flag != 0:
+        if self.F & FLAG_C:
             self.set_memory_address((self.SP - 1) & 0xFFFF, self.PC >> 8)  # High
             self.set_memory_address((self.SP - 2) & 0xFFFF, self.PC & 0xFF)  # Low
             self.SP -= 2
@@ -2155,15 +1782,9 @@ class CPU:
             return 12
 
     def SBC_DE(self, value):  # DE SBC A,d8
-        temp = self.A - value - self.c_flag != 0
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (value & 0xF) - self.c_flag != 0) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SBC_TABLE[(self.A << 8) | value | ((self.F & FLAG_C) << CARRY_16)]
+        self.A = temp >> 8
+        self.F = temp & 0xFF
         self.PC += 2
         return 8
 
@@ -2202,13 +1823,8 @@ class CPU:
         return 16
 
     def AND_E6(self, value):  # E6 AND d8
-        temp = self.A & value
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A & value
+        self.F = AND_FLAGS[self.A]
         self.PC += 2
         return 8
 
@@ -2224,8 +1840,8 @@ class CPU:
     def ADD_E8(self, value):  # E8 ADD SP,r8
         temp = self.SP + ((value ^ 0x80) - 0x80)
         flag = 0b00000000
-        flag += (((self.SP & 0xF) + (value & 0xF)) > 0xF) << self.h_flag
-        flag += (((self.SP & 0xFF) + (value & 0xFF)) > 0xFF) << self.c_flag
+        flag += (((self.SP & 0xF) + (value & 0xF)) > 0xF) * FLAG_H
+        flag += (((self.SP & 0xFF) + (value & 0xFF)) > 0xFF) * FLAG_C
         self.F &= 0b00000000
         self.F |= flag
         temp &= 0xFFFF
@@ -2243,13 +1859,8 @@ class CPU:
         return 16
 
     def XOR_EE(self, value):  # EE XOR d8
-        temp = self.A ^ value
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A ^ value
+        self.F = OR_FLAGS[self.A]
         self.PC += 2
         return 8
 
@@ -2281,7 +1892,7 @@ class CPU:
         return 8
 
     def DI_F3(self):  # F3 DI
-        self.interrupt_master_enable = False
+        self.motherboard.interrupts.disable()
         self.PC += 1
         return 4
 
@@ -2294,13 +1905,8 @@ class CPU:
         return 16
 
     def OR_F6(self, value):  # F6 OR d8
-        temp = self.A | value
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        self.A = self.A | value
+        self.F = OR_FLAGS[self.A]
         self.PC += 2
         return 8
 
@@ -2315,10 +1921,9 @@ class CPU:
 
     def LD_F8(self, value):  # F8 LD HL,SP+r8
         self.HL = self.SP + ((value ^ 0x80) - 0x80)
-        temp = self.HL
         flag = 0b00000000
-        flag += (((self.SP & 0xF) + (value & 0xF)) > 0xF) << self.h_flag
-        flag += (((self.SP & 0xFF) + (value & 0xFF)) > 0xFF) << self.c_flag
+        flag += (((self.SP & 0xF) + (value & 0xF)) > 0xF) * FLAG_H
+        flag += (((self.SP & 0xFF) + (value & 0xFF)) > 0xFF) * FLAG_C
         self.F &= 0b00000000
         self.F |= flag
         self.HL &= 0xFFFF
@@ -2336,19 +1941,13 @@ class CPU:
         return 16
 
     def EI_FB(self):  # FB EI
-        self.interrupt_master_enable = True
+        self.motherboard.interrupts.enable_later()
         self.PC += 1
         return 4
 
     def CP_FE(self, value):  # FE CP d8
-        temp = self.A - value
-        flag = 0b01000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (((self.A & 0xF) - (value & 0xF)) < 0) << self.h_flag
-        flag += (temp < 0) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
+        temp = SBC_TABLE[(self.A << 8) | value]
+        self.F = temp & 0xFF
         self.PC += 2
         return 8
 
@@ -2362,1338 +1961,770 @@ class CPU:
         return 16
 
     def RLC_100(self):  # 100 RLC B
-        temp = (self.B << 1) + (self.B >> 7)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.B = temp
+        temp = RLC_TABLE[self.B]
+        self.F = temp & 0xFF
+        self.B = temp >> 8
         self.PC += 2
         return 8
 
     def RLC_101(self):  # 101 RLC C
-        temp = (self.C << 1) + (self.C >> 7)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.C = temp
+        temp = RLC_TABLE[self.C]
+        self.F = temp & 0xFF
+        self.C = temp >> 8
         self.PC += 2
         return 8
 
     def RLC_102(self):  # 102 RLC D
-        temp = (self.D << 1) + (self.D >> 7)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.D = temp
+        temp = RLC_TABLE[self.D]
+        self.F = temp & 0xFF
+        self.D = temp >> 8
         self.PC += 2
         return 8
 
     def RLC_103(self):  # 103 RLC E
-        temp = (self.E << 1) + (self.E >> 7)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.E = temp
+        temp = RLC_TABLE[self.E]
+        self.F = temp & 0xFF
+        self.E = temp >> 8
         self.PC += 2
         return 8
 
     def RLC_104(self):  # 104 RLC H
-        temp = ((self.HL >> 8) << 1) + ((self.HL >> 8) >> 7)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0x00FF) | (temp << 8)
+        temp = RLC_TABLE[(self.HL >> 8)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0x00FF) | (temp & 0xFF00)
         self.PC += 2
         return 8
 
     def RLC_105(self):  # 105 RLC L
-        temp = ((self.HL & 0xFF) << 1) + ((self.HL & 0xFF) >> 7)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0xFF00) | (temp & 0xFF)
+        temp = RLC_TABLE[(self.HL & 0xFF)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0xFF00) | (temp >> 8)
         self.PC += 2
         return 8
 
     def RLC_106(self):  # 106 RLC (HL)
-        temp = (self.fetch_memory_address(self.HL) << 1) + (self.fetch_memory_address(self.HL) >> 7)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.set_memory_address(self.HL, temp)
+        temp = RLC_TABLE[self.fetch_memory_address(self.HL)]
+        self.F = temp & 0xFF
+        self.set_memory_address(self.HL, (temp >> 8))
         self.PC += 2
         return 16
 
     def RLC_107(self):  # 107 RLC A
-        temp = (self.A << 1) + (self.A >> 7)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = RLC_TABLE[self.A]
+        self.F = temp & 0xFF
+        self.A = temp >> 8
         self.PC += 2
         return 8
 
     def RRC_108(self):  # 108 RRC B
-        temp = (self.B >> 1) + ((self.B & 1) << 7) + ((self.B & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.B = temp
+        temp = RRC_TABLE[self.B]
+        self.F = temp & 0xFF
+        self.B = temp >> 8
         self.PC += 2
         return 8
 
     def RRC_109(self):  # 109 RRC C
-        temp = (self.C >> 1) + ((self.C & 1) << 7) + ((self.C & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.C = temp
+        temp = RRC_TABLE[self.C]
+        self.F = temp & 0xFF
+        self.C = temp >> 8
         self.PC += 2
         return 8
 
     def RRC_10A(self):  # 10A RRC D
-        temp = (self.D >> 1) + ((self.D & 1) << 7) + ((self.D & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.D = temp
+        temp = RRC_TABLE[self.D]
+        self.F = temp & 0xFF
+        self.D = temp >> 8
         self.PC += 2
         return 8
 
     def RRC_10B(self):  # 10B RRC E
-        temp = (self.E >> 1) + ((self.E & 1) << 7) + ((self.E & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.E = temp
+        temp = RRC_TABLE[self.E]
+        self.F = temp & 0xFF
+        self.E = temp >> 8
         self.PC += 2
         return 8
 
     def RRC_10C(self):  # 10C RRC H
-        temp = ((self.HL >> 8) >> 1) + (((self.HL >> 8) & 1) << 7) + (((self.HL >> 8) & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0x00FF) | (temp << 8)
+        temp = RRC_TABLE[(self.HL >> 8)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0x00FF) | (temp & 0xFF00)
         self.PC += 2
         return 8
 
     def RRC_10D(self):  # 10D RRC L
-        temp = ((self.HL & 0xFF) >> 1) + (((self.HL & 0xFF) & 1) << 7) + (((self.HL & 0xFF) & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0xFF00) | (temp & 0xFF)
+        temp = RRC_TABLE[(self.HL & 0xFF)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0xFF00) | (temp >> 8)
         self.PC += 2
         return 8
 
     def RRC_10E(self):  # 10E RRC (HL)
-        temp = (self.fetch_memory_address(self.HL) >> 1) + ((self.fetch_memory_address(self.HL) & 1) << 7) + ((self.fetch_memory_address(self.HL) & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.set_memory_address(self.HL, temp)
+        temp = RRC_TABLE[self.fetch_memory_address(self.HL)]
+        self.F = temp & 0xFF
+        self.set_memory_address(self.HL, (temp >> 8))
         self.PC += 2
         return 16
 
     def RRC_10F(self):  # 10F RRC A
-        temp = (self.A >> 1) + ((self.A & 1) << 7) + ((self.A & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = RRC_TABLE[self.A]
+        self.F = temp & 0xFF
+        self.A = temp >> 8
         self.PC += 2
         return 8
 
     def RL_110(self):  # 110 RL B
-        temp = (self.B << 1) + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.B = temp
+        temp = RL_TABLE[self.B | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.B = temp >> 8
         self.PC += 2
         return 8
 
     def RL_111(self):  # 111 RL C
-        temp = (self.C << 1) + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.C = temp
+        temp = RL_TABLE[self.C | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.C = temp >> 8
         self.PC += 2
         return 8
 
     def RL_112(self):  # 112 RL D
-        temp = (self.D << 1) + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.D = temp
+        temp = RL_TABLE[self.D | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.D = temp >> 8
         self.PC += 2
         return 8
 
     def RL_113(self):  # 113 RL E
-        temp = (self.E << 1) + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.E = temp
+        temp = RL_TABLE[self.E | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.E = temp >> 8
         self.PC += 2
         return 8
 
     def RL_114(self):  # 114 RL H
-        temp = ((self.HL >> 8) << 1) + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0x00FF) | (temp << 8)
+        temp = RL_TABLE[(self.HL >> 8) | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0x00FF) | (temp & 0xFF00)
         self.PC += 2
         return 8
 
     def RL_115(self):  # 115 RL L
-        temp = ((self.HL & 0xFF) << 1) + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0xFF00) | (temp & 0xFF)
+        temp = RL_TABLE[(self.HL & 0xFF) | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0xFF00) | (temp >> 8)
         self.PC += 2
         return 8
 
     def RL_116(self):  # 116 RL (HL)
-        temp = (self.fetch_memory_address(self.HL) << 1) + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.set_memory_address(self.HL, temp)
+        temp = RL_TABLE[self.fetch_memory_address(self.HL) | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.set_memory_address(self.HL, (temp >> 8))
         self.PC += 2
         return 16
 
     def RL_117(self):  # 117 RL A
-        temp = (self.A << 1) + self.c_flag != 0
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = RL_TABLE[self.A | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.A = temp >> 8
         self.PC += 2
         return 8
 
     def RR_118(self):  # 118 RR B
-        temp = (self.B >> 1) + (self.c_flag != 0 << 7) + ((self.B & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.B = temp
+        temp = RR_TABLE[self.B | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.B = temp >> 8
         self.PC += 2
         return 8
 
     def RR_119(self):  # 119 RR C
-        temp = (self.C >> 1) + (self.c_flag != 0 << 7) + ((self.C & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.C = temp
+        temp = RR_TABLE[self.C | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.C = temp >> 8
         self.PC += 2
         return 8
 
     def RR_11A(self):  # 11A RR D
-        temp = (self.D >> 1) + (self.c_flag != 0 << 7) + ((self.D & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.D = temp
+        temp = RR_TABLE[self.D | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.D = temp >> 8
         self.PC += 2
         return 8
 
     def RR_11B(self):  # 11B RR E
-        temp = (self.E >> 1) + (self.c_flag != 0 << 7) + ((self.E & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.E = temp
+        temp = RR_TABLE[self.E | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.E = temp >> 8
         self.PC += 2
         return 8
 
     def RR_11C(self):  # 11C RR H
-        temp = ((self.HL >> 8) >> 1) + (self.c_flag != 0 << 7) + (((self.HL >> 8) & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0x00FF) | (temp << 8)
+        temp = RR_TABLE[(self.HL >> 8) | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0x00FF) | (temp & 0xFF00)
         self.PC += 2
         return 8
 
     def RR_11D(self):  # 11D RR L
-        temp = ((self.HL & 0xFF) >> 1) + (self.c_flag != 0 << 7) + (((self.HL & 0xFF) & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0xFF00) | (temp & 0xFF)
+        temp = RR_TABLE[(self.HL & 0xFF) | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0xFF00) | (temp >> 8)
         self.PC += 2
         return 8
 
     def RR_11E(self):  # 11E RR (HL)
-        temp = (self.fetch_memory_address(self.HL) >> 1) + (self.c_flag != 0 << 7) + ((self.fetch_memory_address(self.HL) & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.set_memory_address(self.HL, temp)
+        temp = RR_TABLE[self.fetch_memory_address(self.HL) | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.set_memory_address(self.HL, (temp >> 8))
         self.PC += 2
         return 16
 
     def RR_11F(self):  # 11F RR A
-        temp = (self.A >> 1) + (self.c_flag != 0 << 7) + ((self.A & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = RR_TABLE[self.A | ((self.F & FLAG_C) << CARRY_8)]
+        self.F = temp & 0xFF
+        self.A = temp >> 8
         self.PC += 2
         return 8
 
     def SLA_120(self):  # 120 SLA B
-        temp = (self.B << 1)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.B = temp
+        temp = SLA_TABLE[self.B]
+        self.F = temp & 0xFF
+        self.B = temp >> 8
         self.PC += 2
         return 8
 
     def SLA_121(self):  # 121 SLA C
-        temp = (self.C << 1)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.C = temp
+        temp = SLA_TABLE[self.C]
+        self.F = temp & 0xFF
+        self.C = temp >> 8
         self.PC += 2
         return 8
 
     def SLA_122(self):  # 122 SLA D
-        temp = (self.D << 1)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.D = temp
+        temp = SLA_TABLE[self.D]
+        self.F = temp & 0xFF
+        self.D = temp >> 8
         self.PC += 2
         return 8
 
     def SLA_123(self):  # 123 SLA E
-        temp = (self.E << 1)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.E = temp
+        temp = SLA_TABLE[self.E]
+        self.F = temp & 0xFF
+        self.E = temp >> 8
         self.PC += 2
         return 8
 
     def SLA_124(self):  # 124 SLA H
-        temp = ((self.HL >> 8) << 1)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0x00FF) | (temp << 8)
+        temp = SLA_TABLE[(self.HL >> 8)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0x00FF) | (temp & 0xFF00)
         self.PC += 2
         return 8
 
     def SLA_125(self):  # 125 SLA L
-        temp = ((self.HL & 0xFF) << 1)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0xFF00) | (temp & 0xFF)
+        temp = SLA_TABLE[(self.HL & 0xFF)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0xFF00) | (temp >> 8)
         self.PC += 2
         return 8
 
     def SLA_126(self):  # 126 SLA (HL)
-        temp = (self.fetch_memory_address(self.HL) << 1)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.set_memory_address(self.HL, temp)
+        temp = SLA_TABLE[self.fetch_memory_address(self.HL)]
+        self.F = temp & 0xFF
+        self.set_memory_address(self.HL, (temp >> 8))
         self.PC += 2
         return 16
 
     def SLA_127(self):  # 127 SLA A
-        temp = (self.A << 1)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SLA_TABLE[self.A]
+        self.F = temp & 0xFF
+        self.A = temp >> 8
         self.PC += 2
         return 8
 
     def SRA_128(self):  # 128 SRA B
-        temp = ((self.B >> 1) | (self.B & 0x80)) + ((self.B & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.B = temp
+        temp = SRA_TABLE[self.B]
+        self.F = temp & 0xFF
+        self.B = temp >> 8
         self.PC += 2
         return 8
 
     def SRA_129(self):  # 129 SRA C
-        temp = ((self.C >> 1) | (self.C & 0x80)) + ((self.C & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.C = temp
+        temp = SRA_TABLE[self.C]
+        self.F = temp & 0xFF
+        self.C = temp >> 8
         self.PC += 2
         return 8
 
     def SRA_12A(self):  # 12A SRA D
-        temp = ((self.D >> 1) | (self.D & 0x80)) + ((self.D & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.D = temp
+        temp = SRA_TABLE[self.D]
+        self.F = temp & 0xFF
+        self.D = temp >> 8
         self.PC += 2
         return 8
 
     def SRA_12B(self):  # 12B SRA E
-        temp = ((self.E >> 1) | (self.E & 0x80)) + ((self.E & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.E = temp
+        temp = SRA_TABLE[self.E]
+        self.F = temp & 0xFF
+        self.E = temp >> 8
         self.PC += 2
         return 8
 
     def SRA_12C(self):  # 12C SRA H
-        temp = (((self.HL >> 8) >> 1) | ((self.HL >> 8) & 0x80)) + (((self.HL >> 8) & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0x00FF) | (temp << 8)
+        temp = SRA_TABLE[(self.HL >> 8)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0x00FF) | (temp & 0xFF00)
         self.PC += 2
         return 8
 
     def SRA_12D(self):  # 12D SRA L
-        temp = (((self.HL & 0xFF) >> 1) | ((self.HL & 0xFF) & 0x80)) + (((self.HL & 0xFF) & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0xFF00) | (temp & 0xFF)
+        temp = SRA_TABLE[(self.HL & 0xFF)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0xFF00) | (temp >> 8)
         self.PC += 2
         return 8
 
     def SRA_12E(self):  # 12E SRA (HL)
-        temp = ((self.fetch_memory_address(self.HL) >> 1) | (self.fetch_memory_address(self.HL) & 0x80)) + ((self.fetch_memory_address(self.HL) & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.set_memory_address(self.HL, temp)
+        temp = SRA_TABLE[self.fetch_memory_address(self.HL)]
+        self.F = temp & 0xFF
+        self.set_memory_address(self.HL, (temp >> 8))
         self.PC += 2
         return 16
 
     def SRA_12F(self):  # 12F SRA A
-        temp = ((self.A >> 1) | (self.A & 0x80)) + ((self.A & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SRA_TABLE[self.A]
+        self.F = temp & 0xFF
+        self.A = temp >> 8
         self.PC += 2
         return 8
 
     def SWAP_130(self):  # 130 SWAP B
-        temp = ((self.B & 0xF0) >> 4) | ((self.B & 0x0F) << 4)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.B = temp
+        temp = SWAP_TABLE[self.B]
+        self.F = temp & 0xFF
+        self.B = temp >> 8
         self.PC += 2
         return 8
 
     def SWAP_131(self):  # 131 SWAP C
-        temp = ((self.C & 0xF0) >> 4) | ((self.C & 0x0F) << 4)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.C = temp
+        temp = SWAP_TABLE[self.C]
+        self.F = temp & 0xFF
+        self.C = temp >> 8
         self.PC += 2
         return 8
 
     def SWAP_132(self):  # 132 SWAP D
-        temp = ((self.D & 0xF0) >> 4) | ((self.D & 0x0F) << 4)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.D = temp
+        temp = SWAP_TABLE[self.D]
+        self.F = temp & 0xFF
+        self.D = temp >> 8
         self.PC += 2
         return 8
 
     def SWAP_133(self):  # 133 SWAP E
-        temp = ((self.E & 0xF0) >> 4) | ((self.E & 0x0F) << 4)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.E = temp
+        temp = SWAP_TABLE[self.E]
+        self.F = temp & 0xFF
+        self.E = temp >> 8
         self.PC += 2
         return 8
 
     def SWAP_134(self):  # 134 SWAP H
-        temp = (((self.HL >> 8) & 0xF0) >> 4) | (((self.HL >> 8) & 0x0F) << 4)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0x00FF) | (temp << 8)
+        temp = SWAP_TABLE[(self.HL >> 8)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0x00FF) | (temp & 0xFF00)
         self.PC += 2
         return 8
 
     def SWAP_135(self):  # 135 SWAP L
-        temp = (((self.HL & 0xFF) & 0xF0) >> 4) | (((self.HL & 0xFF) & 0x0F) << 4)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0xFF00) | (temp & 0xFF)
+        temp = SWAP_TABLE[(self.HL & 0xFF)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0xFF00) | (temp >> 8)
         self.PC += 2
         return 8
 
     def SWAP_136(self):  # 136 SWAP (HL)
-        temp = ((self.fetch_memory_address(self.HL) & 0xF0) >> 4) | ((self.fetch_memory_address(self.HL) & 0x0F) << 4)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.set_memory_address(self.HL, temp)
+        temp = SWAP_TABLE[self.fetch_memory_address(self.HL)]
+        self.F = temp & 0xFF
+        self.set_memory_address(self.HL, (temp >> 8))
         self.PC += 2
         return 16
 
     def SWAP_137(self):  # 137 SWAP A
-        temp = ((self.A & 0xF0) >> 4) | ((self.A & 0x0F) << 4)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SWAP_TABLE[self.A]
+        self.F = temp & 0xFF
+        self.A = temp >> 8
         self.PC += 2
         return 8
 
     def SRL_138(self):  # 138 SRL B
-        temp = (self.B >> 1) + ((self.B & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.B = temp
+        temp = SRL_TABLE[self.B]
+        self.F = temp & 0xFF
+        self.B = temp >> 8
         self.PC += 2
         return 8
 
     def SRL_139(self):  # 139 SRL C
-        temp = (self.C >> 1) + ((self.C & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.C = temp
+        temp = SRL_TABLE[self.C]
+        self.F = temp & 0xFF
+        self.C = temp >> 8
         self.PC += 2
         return 8
 
     def SRL_13A(self):  # 13A SRL D
-        temp = (self.D >> 1) + ((self.D & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.D = temp
+        temp = SRL_TABLE[self.D]
+        self.F = temp & 0xFF
+        self.D = temp >> 8
         self.PC += 2
         return 8
 
     def SRL_13B(self):  # 13B SRL E
-        temp = (self.E >> 1) + ((self.E & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.E = temp
+        temp = SRL_TABLE[self.E]
+        self.F = temp & 0xFF
+        self.E = temp >> 8
         self.PC += 2
         return 8
 
     def SRL_13C(self):  # 13C SRL H
-        temp = ((self.HL >> 8) >> 1) + (((self.HL >> 8) & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0x00FF) | (temp << 8)
+        temp = SRL_TABLE[(self.HL >> 8)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0x00FF) | (temp & 0xFF00)
         self.PC += 2
         return 8
 
     def SRL_13D(self):  # 13D SRL L
-        temp = ((self.HL & 0xFF) >> 1) + (((self.HL & 0xFF) & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.HL = (self.HL & 0xFF00) | (temp & 0xFF)
+        temp = SRL_TABLE[(self.HL & 0xFF)]
+        self.F = temp & 0xFF
+        self.HL = (self.HL & 0xFF00) | (temp >> 8)
         self.PC += 2
         return 8
 
     def SRL_13E(self):  # 13E SRL (HL)
-        temp = (self.fetch_memory_address(self.HL) >> 1) + ((self.fetch_memory_address(self.HL) & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.set_memory_address(self.HL, temp)
+        temp = SRL_TABLE[self.fetch_memory_address(self.HL)]
+        self.F = temp & 0xFF
+        self.set_memory_address(self.HL, (temp >> 8))
         self.PC += 2
         return 16
 
     def SRL_13F(self):  # 13F SRL A
-        temp = (self.A >> 1) + ((self.A & 1) << 8)
-        flag = 0b00000000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        flag += (temp > 0xFF) << self.c_flag
-        self.F &= 0b00000000
-        self.F |= flag
-        temp &= 0xFF
-        self.A = temp
+        temp = SRL_TABLE[self.A]
+        self.F = temp & 0xFF
+        self.A = temp >> 8
         self.PC += 2
         return 8
 
     def BIT_140(self):  # 140 BIT 0,B
-        temp = self.B & (1 << 0)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.B & 0x01 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_141(self):  # 141 BIT 0,C
-        temp = self.C & (1 << 0)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.C & 0x01 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_142(self):  # 142 BIT 0,D
-        temp = self.D & (1 << 0)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.D & 0x01 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_143(self):  # 143 BIT 0,E
-        temp = self.E & (1 << 0)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.E & 0x01 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_144(self):  # 144 BIT 0,H
-        temp = (self.HL >> 8) & (1 << 0)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL >> 8) & 0x01 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_145(self):  # 145 BIT 0,L
-        temp = (self.HL & 0xFF) & (1 << 0)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL & 0xFF) & 0x01 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_146(self):  # 146 BIT 0,(HL)
-        temp = self.fetch_memory_address(self.HL) & (1 << 0)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.fetch_memory_address(self.HL) & 0x01 else FLAG_Z | FLAG_H)
         self.PC += 2
-        return 16
+        return 12
 
     def BIT_147(self):  # 147 BIT 0,A
-        temp = self.A & (1 << 0)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.A & 0x01 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_148(self):  # 148 BIT 1,B
-        temp = self.B & (1 << 1)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.B & 0x02 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_149(self):  # 149 BIT 1,C
-        temp = self.C & (1 << 1)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.C & 0x02 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_14A(self):  # 14A BIT 1,D
-        temp = self.D & (1 << 1)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.D & 0x02 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_14B(self):  # 14B BIT 1,E
-        temp = self.E & (1 << 1)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.E & 0x02 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_14C(self):  # 14C BIT 1,H
-        temp = (self.HL >> 8) & (1 << 1)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL >> 8) & 0x02 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_14D(self):  # 14D BIT 1,L
-        temp = (self.HL & 0xFF) & (1 << 1)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL & 0xFF) & 0x02 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_14E(self):  # 14E BIT 1,(HL)
-        temp = self.fetch_memory_address(self.HL) & (1 << 1)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.fetch_memory_address(self.HL) & 0x02 else FLAG_Z | FLAG_H)
         self.PC += 2
-        return 16
+        return 12
 
     def BIT_14F(self):  # 14F BIT 1,A
-        temp = self.A & (1 << 1)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.A & 0x02 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_150(self):  # 150 BIT 2,B
-        temp = self.B & (1 << 2)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.B & 0x04 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_151(self):  # 151 BIT 2,C
-        temp = self.C & (1 << 2)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.C & 0x04 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_152(self):  # 152 BIT 2,D
-        temp = self.D & (1 << 2)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.D & 0x04 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_153(self):  # 153 BIT 2,E
-        temp = self.E & (1 << 2)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.E & 0x04 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_154(self):  # 154 BIT 2,H
-        temp = (self.HL >> 8) & (1 << 2)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL >> 8) & 0x04 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_155(self):  # 155 BIT 2,L
-        temp = (self.HL & 0xFF) & (1 << 2)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL & 0xFF) & 0x04 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_156(self):  # 156 BIT 2,(HL)
-        temp = self.fetch_memory_address(self.HL) & (1 << 2)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.fetch_memory_address(self.HL) & 0x04 else FLAG_Z | FLAG_H)
         self.PC += 2
-        return 16
+        return 12
 
     def BIT_157(self):  # 157 BIT 2,A
-        temp = self.A & (1 << 2)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.A & 0x04 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_158(self):  # 158 BIT 3,B
-        temp = self.B & (1 << 3)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.B & 0x08 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_159(self):  # 159 BIT 3,C
-        temp = self.C & (1 << 3)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.C & 0x08 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_15A(self):  # 15A BIT 3,D
-        temp = self.D & (1 << 3)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.D & 0x08 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_15B(self):  # 15B BIT 3,E
-        temp = self.E & (1 << 3)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.E & 0x08 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_15C(self):  # 15C BIT 3,H
-        temp = (self.HL >> 8) & (1 << 3)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL >> 8) & 0x08 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_15D(self):  # 15D BIT 3,L
-        temp = (self.HL & 0xFF) & (1 << 3)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL & 0xFF) & 0x08 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_15E(self):  # 15E BIT 3,(HL)
-        temp = self.fetch_memory_address(self.HL) & (1 << 3)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.fetch_memory_address(self.HL) & 0x08 else FLAG_Z | FLAG_H)
         self.PC += 2
-        return 16
+        return 12
 
     def BIT_15F(self):  # 15F BIT 3,A
-        temp = self.A & (1 << 3)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.A & 0x08 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_160(self):  # 160 BIT 4,B
-        temp = self.B & (1 << 4)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.B & 0x10 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_161(self):  # 161 BIT 4,C
-        temp = self.C & (1 << 4)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.C & 0x10 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_162(self):  # 162 BIT 4,D
-        temp = self.D & (1 << 4)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.D & 0x10 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_163(self):  # 163 BIT 4,E
-        temp = self.E & (1 << 4)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.E & 0x10 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_164(self):  # 164 BIT 4,H
-        temp = (self.HL >> 8) & (1 << 4)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL >> 8) & 0x10 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_165(self):  # 165 BIT 4,L
-        temp = (self.HL & 0xFF) & (1 << 4)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL & 0xFF) & 0x10 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_166(self):  # 166 BIT 4,(HL)
-        temp = self.fetch_memory_address(self.HL) & (1 << 4)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.fetch_memory_address(self.HL) & 0x10 else FLAG_Z | FLAG_H)
         self.PC += 2
-        return 16
+        return 12
 
     def BIT_167(self):  # 167 BIT 4,A
-        temp = self.A & (1 << 4)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.A & 0x10 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_168(self):  # 168 BIT 5,B
-        temp = self.B & (1 << 5)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.B & 0x20 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_169(self):  # 169 BIT 5,C
-        temp = self.C & (1 << 5)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.C & 0x20 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_16A(self):  # 16A BIT 5,D
-        temp = self.D & (1 << 5)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.D & 0x20 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_16B(self):  # 16B BIT 5,E
-        temp = self.E & (1 << 5)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.E & 0x20 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_16C(self):  # 16C BIT 5,H
-        temp = (self.HL >> 8) & (1 << 5)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL >> 8) & 0x20 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_16D(self):  # 16D BIT 5,L
-        temp = (self.HL & 0xFF) & (1 << 5)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL & 0xFF) & 0x20 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_16E(self):  # 16E BIT 5,(HL)
-        temp = self.fetch_memory_address(self.HL) & (1 << 5)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.fetch_memory_address(self.HL) & 0x20 else FLAG_Z | FLAG_H)
         self.PC += 2
-        return 16
+        return 12
 
     def BIT_16F(self):  # 16F BIT 5,A
-        temp = self.A & (1 << 5)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.A & 0x20 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_170(self):  # 170 BIT 6,B
-        temp = self.B & (1 << 6)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.B & 0x40 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_171(self):  # 171 BIT 6,C
-        temp = self.C & (1 << 6)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.C & 0x40 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_172(self):  # 172 BIT 6,D
-        temp = self.D & (1 << 6)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.D & 0x40 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_173(self):  # 173 BIT 6,E
-        temp = self.E & (1 << 6)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.E & 0x40 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_174(self):  # 174 BIT 6,H
-        temp = (self.HL >> 8) & (1 << 6)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL >> 8) & 0x40 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_175(self):  # 175 BIT 6,L
-        temp = (self.HL & 0xFF) & (1 << 6)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL & 0xFF) & 0x40 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_176(self):  # 176 BIT 6,(HL)
-        temp = self.fetch_memory_address(self.HL) & (1 << 6)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.fetch_memory_address(self.HL) & 0x40 else FLAG_Z | FLAG_H)
         self.PC += 2
-        return 16
+        return 12
 
     def BIT_177(self):  # 177 BIT 6,A
-        temp = self.A & (1 << 6)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.A & 0x40 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_178(self):  # 178 BIT 7,B
-        temp = self.B & (1 << 7)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.B & 0x80 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_179(self):  # 179 BIT 7,C
-        temp = self.C & (1 << 7)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.C & 0x80 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_17A(self):  # 17A BIT 7,D
-        temp = self.D & (1 << 7)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.D & 0x80 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_17B(self):  # 17B BIT 7,E
-        temp = self.E & (1 << 7)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.E & 0x80 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_17C(self):  # 17C BIT 7,H
-        temp = (self.HL >> 8) & (1 << 7)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL >> 8) & 0x80 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_17D(self):  # 17D BIT 7,L
-        temp = (self.HL & 0xFF) & (1 << 7)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if (self.HL & 0xFF) & 0x80 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
     def BIT_17E(self):  # 17E BIT 7,(HL)
-        temp = self.fetch_memory_address(self.HL) & (1 << 7)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.fetch_memory_address(self.HL) & 0x80 else FLAG_Z | FLAG_H)
         self.PC += 2
-        return 16
+        return 12
 
     def BIT_17F(self):  # 17F BIT 7,A
-        temp = self.A & (1 << 7)
-        flag = 0b00100000
-        flag += ((temp & 0xFF) == 0) << self.z_flag
-        self.F &= 0b00010000
-        self.F |= flag
+        self.F = (self.F & FLAG_C) | (FLAG_H if self.A & 0x80 else FLAG_Z | FLAG_H)
         self.PC += 2
         return 8
 
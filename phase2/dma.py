@@ -0,0 +1,56 @@
+import logging
+import sys
+
+from phase2.mmu import OAM
+
+logging.basicConfig(stream=sys.stdout,
+                    level=logging.INFO,
+                    format='[%(asctime)s] {%(filename)s:%(lineno)d} %(levelname)s - %(message)s')
+
+DMA = 0xFF46
+DMA_LENGTH = OAM[1] - OAM[0]  # 160 bytes
+DMA_CYCLES = 4 * DMA_LENGTH  # One byte per M-cycle, 160 us
+
+
+class OAMDMA:
+    """
+    A write to 0xFF46 copies 0xXX00-0xXX9F into OAM.
+
+    The transfer is one event on the timeline rather than 160 byte writes: the write locks the bus
+    (data reads return 0xFF outside the 0xFF page while ``dma_active`` is set) and the whole block
+    lands in OAM as a single memoryview copy when the 640 cycles are up.
+
+    The lockout covers data reads only. Instruction fetches, in the interpreter, ``execute`` and the
+    block compiler alike, go through ``MMU.peek`` and see the real bytes, so code keeps running
+    wherever it is rather than only from HRAM.
+    """
+
+    def __init__(self, motherboard):
+        self.ram = motherboard.ram
+        self.mmu = motherboard.mmu
+        self.scheduler = motherboard.scheduler
+        self.source = 0
+
+        self.mmu.register_io(DMA, write=self.start)
+
+    def start(self, address, value):
+        self.ram.memory[DMA] = value
+        self.source = value << 8
+        self.mmu.dma_active = True
+        # Restarting a running transfer replaces it
+        self.scheduler.schedule('dma', self.scheduler.cycles + DMA_CYCLES, self.finish)
+
+    def finish(self, cycle):
+        page = self.source >> 8
+        buffer = self.mmu.read_buffers[page]
+        if buffer is None:
+            # Handler page (disabled cartridge RAM, I/O), go through the MMU a byte at a time
+            self.mmu.dma_active = False
+            data = bytes(self.mmu.read(self.source + i) for i in range(DMA_LENGTH))
+        else:
+            offset = self.source - self.mmu.read_bases[page]
+            data = memoryview(buffer)[offset:offset + DMA_LENGTH]
+
+        self.ram.load_region(OAM[0], data)
+        self.mmu.dma_active = False
+        logging.debug(f"OAM DMA from {self.source:04X}")
@@ -0,0 +1,231 @@
+import logging
+import sys
+
+from phase2.timer import DIV, TIMA
+
+logging.basicConfig(stream=sys.stdout,
+                    level=logging.INFO,
+                    format='[%(asctime)s] {%(filename)s:%(lineno)d} %(levelname)s - %(message)s')
+
+MAX_LOOP_LENGTH = 16
+
+REGISTERS = {'A', 'B', 'C', 'D', 'E', 'H', 'L'}
+PAIRS = {'BC': {'B', 'C'}, 'DE': {'D', 'E'}, 'HL': {'H', 'L'}}
+CONSTANTS = {'d8', 'd16', 'a8', 'a16'}
+CONDITIONS = {'NZ', 'Z', 'NC', 'C'}
+ALU = {'ADD', 'ADC', 'SUB', 'SBC', 'AND', 'XOR', 'OR', 'CP'}
+
+# Registers that change with the clock but without an event (derived on read), never idle to poll
+VOLATILE_IO = {DIV, TIMA}
+
+
+def operand_reads(operand):
+    """
+    Registers an operand reads, None if the operand is something a polling loop can't use.
+    """
+    name = operand['name']
+    if operand.get('increment') or operand.get('decrement'):
+        return None
+    if name in CONSTANTS:
+        # Immediate values and fixed addresses (LDH A,(a8) / LD A,(a16))
+        return set()
+    if name in REGISTERS:
+        return {name}
+    if name in PAIRS:
+        return set(PAIRS[name])
+    return None
+
+
+def effects(opcode):
+    """
+    (registers read, registers written) of an instruction that only moves data between registers,
+    or None if it writes memory, touches the stack or otherwise can't be part of an idle loop.
+    F counts as a register.
+    """
+    mnemonic = opcode['mnemonic']
+    operands = opcode['operands']
+
+    if mnemonic == 'NOP':
+        return set(), set()
+
+    if mnemonic in ('LD', 'LDH') and len(operands) == 2:
+        dst, src = operands
+        reads = operand_reads(src)
+        if reads is None or not dst['immediate']:
+            return None
+        if dst['name'] in REGISTERS:
+            return reads, {dst['name']}
+        if dst['name'] in PAIRS:
+            return reads, set(PAIRS[dst['name']])
+        return None
+
+    if mnemonic in ALU:
+        reads = operand_reads(operands[-1])
+        if reads is None:
+            return None
+        reads |= {'A', 'F'} if mnemonic in ('ADC', 'SBC') else {'A'}
+        return reads, {'F'} if mnemonic == 'CP' else {'A', 'F'}
+
+    if mnemonic in ('INC', 'DEC') and operands[0]['immediate']:
+        reads = operand_reads(operands[0])
+        if reads is None:
+            return None
+        # 8-bit INC/DEC set flags, the 16-bit ones don't
+        return reads, reads | ({'F'} if operands[0]['name'] in REGISTERS else set())
+
+    if mnemonic == 'BIT':
+        reads = operand_reads(operands[1])
+        return None if reads is None else (reads, {'F'})
+
+    if mnemonic == 'CPL':
+        return {'A'}, {'A'}
+
+    return None
+
+
+class IdleLoopDetector:
+    """
+    Finds busy-wait polling loops and skips their iterations.
+
+    A loop qualifies when it is straight-line code closed by a conditional JR/JP back to its start,
+    never writes memory, and every register it writes is written before it is read. One iteration
+    then leaves the CPU in exactly the same state, so nothing changes until the polled memory does,
+    and that only happens on a scheduled event (LY, timer, an interrupt handler writing a WRAM flag).
+    The detector jumps straight to that event in whole iterations. Loops polling VOLATILE_IO, which
+    changes with no event at all, are never skipped.
+
+    Only loops in ROM are cached, code in RAM can be rewritten under us.
+
+    The interpreter runs events between instructions, so an iteration can read the polled value
+    just before an event changes it and still take the branch. It only skips after a whole iteration
+    with no event fired since the previous trip round the loop. Blocks only see events between
+    blocks, so a loop that is one block never has that problem.
+    """
+
+    def __init__(self, cpu):
+        self.cpu = cpu
+        # (address, bank) -> (cycles per iteration, address of the closing branch, pointer registers) or None
+        self.loops = {}
+        # (loop start, scheduler.fired) at the last backward jump the interpreter reported
+        self.iteration_start = None
+
+        self.loops_detected = 0
+        self.skips = 0
+        self.cycles_skipped = 0
+
+    def skip(self, target, now, remaining, branch_pc=None):
+        """
+        Called after a backward jump to `target`. If the loop there is idle, skips as many
+        iterations as fit before the scheduler's next event or the end of the budget.
+
+        :return: cycles skipped
+        """
+        scheduler = self.cpu.motherboard.scheduler
+        if branch_pc is not None:
+            # Interpreter: the iteration that just ended is only current if no event ran during it
+            iteration = (target, scheduler.fired)
+            clean = iteration == self.iteration_start
+            self.iteration_start = iteration
+            if not clean:
+                return 0
+
+        if target >= 0x8000:
+            return 0
+
+        key = self.cpu.block_compiler.block_key(target)
+        if key not in self.loops:
+            loop = self.loops[key] = self.analyse(target)
+            if loop is not None:
+                self.loops_detected += 1
+                logging.info(f"Idle loop at {target:04X}, {loop[0]} cycles per iteration")
+
+        loop = self.loops[key]
+        if loop is None:
+            return 0
+
+        iteration_cycles, loop_branch_pc, pointers = loop
+        # Only skip once the loop has really gone round: we arrived here from its own branch
+        if branch_pc is not None and branch_pc != loop_branch_pc:
+            return 0
+        # Registers aren't known until run time, (HL) can point at DIV as well as at a WRAM flag
+        if any(self.pointer_address(pointer) in VOLATILE_IO for pointer in pointers):
+            return 0
+
+        wait = min(remaining, scheduler.deadline - now)
+        iterations = wait // iteration_cycles
+        if iterations <= 0:
+            return 0
+
+        skipped = iterations * iteration_cycles
+        self.skips += 1
+        self.cycles_skipped += skipped
+        return skipped
+
+    def pointer_address(self, register):
+        # (C) is 0xFF00 + C, (BC)/(DE)/(HL) the pair itself
+        if register == 'C':
+            return 0xFF00 + self.cpu.C
+        return getattr(self.cpu, register)
+
+    def analyse(self, target):
+        decoder = self.cpu.block_compiler
+        body = []
+        # Registers the loop reads memory through
+        pointers = set()
+        cycles = 0
+        address = target
+
+        for _ in range(MAX_LOOP_LENGTH):
+            index, value, length = decoder.decode(address)
+            opcode = decoder.opcode_info(index)
+            operands = opcode['operands']
+
+            if opcode['mnemonic'] in ('JR', 'JP') and operands and operands[0]['name'] in CONDITIONS:
+                if opcode['mnemonic'] == 'JR':
+                    destination = (address + length + ((value ^ 0x80) - 0x80)) & 0xFFFF
+                else:
+                    destination = value
+                if destination != target:
+                    return None
+
+                body.append(({'F'}, set()))
+                if not self.is_idempotent(body):
+                    return None
+                return cycles + opcode['cycles'][0], address, tuple(pointers)
+
+            effect = effects(opcode)
+            if effect is None:
+                return None
+            for operand in operands:
+                if operand['immediate']:
+                    continue
+                if operand['name'] == 'a8' and 0xFF00 + value in VOLATILE_IO:
+                    return None
+                if operand['name'] == 'a16' and value in VOLATILE_IO:
+                    return None
+                if operand['name'] in ('C', 'BC', 'DE', 'HL'):
+                    pointers.add(operand['name'])
+
+            body.append(effect)
+            cycles += opcode['cycles'][0]
+            address = (address + length) & 0xFFFF
+
+        return None
+
+    @staticmethod
+    def is_idempotent(body):
+        # A register read before the loop writes it carries state from one iteration to the next
+        loop_writes = set().union(*(writes for _, writes in body))
+        written = set()
+        for reads, writes in body:
+            if (reads & loop_writes) - written:
+                return False
+            written |= writes
+        return True
+
+    def stats(self):
+        return {
+            'idle_loops_detected': self.loops_detected,
+            'idle_loop_skips': self.skips,
+            'idle_cycles_skipped': self.cycles_skipped,
+        }
@@ -0,0 +1,91 @@
+IF = 0xFF0F  # Interrupt flags, requested
+IE = 0xFFFF  # Interrupt enable
+
+VBLANK = 0x01
+LCD_STAT = 0x02
+TIMER = 0x04
+SERIAL = 0x08
+JOYPAD = 0x10
+
+VECTORS = {VBLANK: 0x40, LCD_STAT: 0x48, TIMER: 0x50, SERIAL: 0x58, JOYPAD: 0x60}
+
+# IE & IF & 0x1F -> (bit, vector) of the highest priority (lowest) bit set
+PRIORITY = tuple(None if pending == 0 else (pending & -pending, VECTORS[pending & -pending])
+                 for pending in range(32))
+
+DISPATCH_CYCLES = 20
+EI_DELAY = 5  # EI's own 4 cycles + 1, so IME turns on after the following instruction
+
+
+class InterruptController:
+    """
+    IF/IE live in ordinary memory behind MMU write hooks; this only decides when to look at them.
+
+    Nothing is polled per instruction. Anything that can make an interrupt pending (a request from a
+    subsystem, a write to IF/IE, EI taking effect, RETI, HALT) schedules an "interrupt" check on
+    the event timeline, and the check wakes a halted CPU and dispatches to the vector if IME is set.
+    """
+
+    def __init__(self, motherboard):
+        self.memory = motherboard.ram.memory
+        self.scheduler = motherboard.scheduler
+        self.cpu = None
+
+        motherboard.mmu.register_io(IF, write=self.write_register)
+        motherboard.mmu.register_io(IE, write=self.write_register)
+
+    def attach(self, cpu):
+        self.cpu = cpu
+
+    def request(self, bit):
+        self.memory[IF] |= bit
+        self.schedule_check()
+
+    def write_register(self, address, value):
+        # A write to IF or IE can make an interrupt pending
+        self.memory[address] = value
+        self.schedule_check()
+
+    def pending(self):
+        return self.memory[IE] & self.memory[IF] & 0x1F
+
+    def schedule_check(self):
+        self.scheduler.schedule('interrupt', self.scheduler.cycles, self.check)
+
+    def enable_later(self):
+        """
+        EI: IME is set once the next instruction has run.
+        """
+        self.scheduler.schedule('ime', self.scheduler.cycles + EI_DELAY, self.enable)
+
+    def enable(self, cycle=None):
+        self.cpu.interrupt_master_enable = True
+        self.schedule_check()
+
+    def disable(self):
+        self.scheduler.cancel('ime')
+        self.cpu.interrupt_master_enable = False
+
+    def check(self, cycle):
+        # Only ever run from the scheduler, so dispatch cycles can go straight onto the clock
+        pending = self.memory[IE] & self.memory[IF] & 0x1F
+        if not pending:
+            return
+
+        cpu = self.cpu
+        # Any pending interrupt ends HALT, even with IME off
+        cpu.halted = False
+        if not cpu.interrupt_master_enable:
+            return
+
+        bit, vector = PRIORITY[pending]
+        self.memory[IF] &= ~bit & 0xFF
+        cpu.interrupt_master_enable = False
+
+        cpu.set_memory_address((cpu.SP - 1) & 0xFFFF, cpu.PC >> 8)  # High
+        cpu.set_memory_address((cpu.SP - 2) & 0xFFFF, cpu.PC & 0xFF)  # Low
+        cpu.SP = (cpu.SP - 2) & 0xFFFF
+        cpu.PC = vector
+
+        # The CPU picks the dispatch time up from the clock after the scheduler returns
+        self.scheduler.cycles += DISPATCH_CYCLES
@@ -0,0 +1,60 @@
+from phase2.interrupts import JOYPAD
+
+JOYP = 0xFF00
+
+# Select bits, active low: bit 5 selects the action buttons, bit 4 the d-pad
+SELECT_ACTION = 0x20
+SELECT_DIRECTION = 0x10
+
+
+def decode_input(code):
+    """
+    The input codes (phase4.inputs) are the JOYP value reading that button, written out in binary
+    digits: 11011110 is A, bit 5 low (action group) and bit 0 low.
+
+    :return: (select bit of its group, button bit)
+    """
+    value = int(str(code), 2)
+    return ~value & 0x30, ~value & 0x0F
+
+
+class Joypad:
+    """
+    JOYP (0xFF00): the game picks a button group with bits 4/5, and the low nibble reads the
+    buttons held in it, 0 meaning pressed. A new press requests the joypad interrupt.
+
+    Input only changes between frames (the emulation thread applies the front-end's queue), never
+    mid run, so polling loops can't miss a press.
+    """
+
+    def __init__(self, motherboard):
+        self.memory = motherboard.ram.memory
+        self.interrupts = motherboard.interrupts
+        # Group select bits -> bits of the buttons held, active high
+        self.held = {SELECT_DIRECTION: 0, SELECT_ACTION: 0}
+        self.memory[JOYP] = 0xCF
+
+        motherboard.mmu.register_io(JOYP, read=self.read, write=self.write)
+
+    def press(self, code):
+        group, bit = decode_input(code)
+        if not self.held[group] & bit:
+            self.held[group] |= bit
+            self.interrupts.request(JOYPAD)
+
+    def release(self, code):
+        group, bit = decode_input(code)
+        self.held[group] &= ~bit
+
+    def read(self, address):
+        select = self.memory[JOYP] & 0x30
+        buttons = 0x0F
+        if not select & SELECT_ACTION:
+            buttons &= ~self.held[SELECT_ACTION]
+        if not select & SELECT_DIRECTION:
+            buttons &= ~self.held[SELECT_DIRECTION]
+        return 0xC0 | select | buttons
+
+    def write(self, address, value):
+        # Only the select bits are writable
+        self.memory[JOYP] = 0xC0 | (value & 0x30) | 0x0F
@@ -0,0 +1,140 @@
+import logging
+import sys
+
+logging.basicConfig(stream=sys.stdout,
+                    level=logging.INFO,
+                    format='[%(asctime)s] {%(filename)s:%(lineno)d} %(levelname)s - %(message)s')
+
+# Memory map, (first address, last address + 1)
+ROM_BANK_0 = (0x0000, 0x4000)
+ROM_BANK_N = (0x4000, 0x8000)
+VRAM = (0x8000, 0xA000)
+EXTERNAL_RAM = (0xA000, 0xC000)
+WRAM = (0xC000, 0xE000)
+ECHO_RAM = (0xE000, 0xFE00)  # Mirror of 0xC000-0xDDFF
+OAM = (0xFE00, 0xFEA0)
+IO = (0xFF00, 0xFF80)
+HRAM = (0xFF80, 0xFFFF)
+
+PAGE_SIZE = 0x100
+
+
+class MMU:
+    """
+    Routes the CPU's 16-bit address space through a 256-entry page table, one entry per high byte.
+
+    A page is either backed by a buffer (``read_buffers[page][address - read_bases[page]]``) or,
+    when the buffer is None, by a handler taking the address. ROM, VRAM, WRAM and OAM are plain
+    buffers so an ordinary read is one index; only the I/O page pays for a callback, and even there
+    registers without a handler read straight from memory.
+
+    Everything starts out backed by the flat 64 KiB `memory`; cartridges and subsystems remap pages
+    and register I/O handlers on top.
+    """
+
+    def __init__(self, memory):
+        self.memory = memory
+
+        self.read_buffers = [memory] * 256
+        self.read_bases = [0] * 256
+        self.read_handlers = [None] * 256
+
+        self.write_buffers = [memory] * 256
+        self.write_bases = [0] * 256
+        self.write_handlers = [None] * 256
+
+        # Per register hooks for 0xFF00-0xFFFF, None reads/writes the backing memory
+        self.io_readers = [None] * 256
+        self.io_writers = [None] * 256
+
+        # OAM DMA owns the bus, data reads outside the 0xFF page return 0xFF (instruction fetches use peek)
+        self.dma_active = False
+
+        # Writes to ROM are cartridge controller commands, a plain cartridge ignores them
+        self.map_write_handler(ROM_BANK_0[0], ROM_BANK_N[1], self.ignore_write)
+
+        # Echo RAM reads and writes WRAM
+        self.map_buffer(ECHO_RAM[0], ECHO_RAM[1], memory, ECHO_RAM[0] - WRAM[0])
+
+        # The last page holds the I/O registers, HRAM and IE
+        self.map_read_handler(0xFF00, 0x10000, self.read_io)
+        self.map_write_handler(0xFF00, 0x10000, self.write_io)
+
+    def map_buffer(self, start, end, buffer, base=None, read=True, write=True):
+        """
+        Backs the pages of [start, end) with `buffer`, `address - base` being the index into it.
+        `base` defaults to `start`, so the region begins at the start of the buffer.
+        """
+        base = start if base is None else base
+        # Slice assignment, a bank switch remaps 64 pages
+        pages = slice(start >> 8, end >> 8)
+        count = (end - start) >> 8
+        if read:
+            self.read_buffers[pages] = [buffer] * count
+            self.read_bases[pages] = [base] * count
+        if write:
+            self.write_buffers[pages] = [buffer] * count
+            self.write_bases[pages] = [base] * count
+
+    def map_read_handler(self, start, end, handler):
+        for page in range(start >> 8, end >> 8):
+            self.read_buffers[page] = None
+            self.read_handlers[page] = handler
+
+    def map_write_handler(self, start, end, handler):
+        for page in range(start >> 8, end >> 8):
+            self.write_buffers[page] = None
+            self.write_handlers[page] = handler
+
+    def register_io(self, address, read=None, write=None):
+        """
+        Hooks an I/O register. `read(address)` returns the value, `write(address, value)` stores it.
+        """
+        if read is not None:
+            self.io_readers[address & 0xFF] = read
+        if write is not None:
+            self.io_writers[address & 0xFF] = write
+
+    def read(self, address):
+        page = address >> 8
+        buffer = self.read_buffers[page]
+        if buffer is None:
+            return self.read_handlers[page](address)
+        if self.dma_active:
+            return 0xFF
+        return buffer[address - self.read_bases[page]]
+
+    def peek(self, address):
+        """
+        Reads past the OAM DMA bus lockout, for decoding instructions.
+        """
+        page = address >> 8
+        buffer = self.read_buffers[page]
+        if buffer is None:
+            return self.read_handlers[page](address)
+        return buffer[address - self.read_bases[page]]
+
+    def write(self, address, value):
+        page = address >> 8
+        buffer = self.write_buffers[page]
+        if buffer is None:
+            self.write_handlers[page](address, value)
+        else:
+            buffer[address - self.write_bases[page]] = value
+
+    def read_io(self, address):
+        reader = self.io_readers[address & 0xFF]
+        if reader is None:
+            return self.memory[address]
+        return reader(address)
+
+    def write_io(self, address, value):
+        writer = self.io_writers[address & 0xFF]
+        if writer is None:
+            self.memory[address] = value
+        else:
+            writer(address, value)
+
+    @staticmethod
+    def ignore_write(address, value):
+        logging.debug(f"Ignored write to ROM: {address:04X} = {value:02X}")
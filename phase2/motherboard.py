@@ -1,8 +1,19 @@
 import logging
 import sys
 
+from phase2.cartridge import load_cartridge
+from phase2.dma import OAMDMA
+from phase2.interrupts import InterruptController
+from phase2.joypad import Joypad
+from phase2.mmu import MMU
 from phase2.ram import RAM
-# from phase3.gpu import GPU
+from phase2.scheduler import Scheduler
+from phase2.timer import Timer
+from phase3.ppu import PPU
+
+# Any write here unmaps the boot ROM for good
+BOOT_ROM_OFF = 0xFF50
+BOOT_ROM_END = 0x100
 
 logging.basicConfig(stream=sys.stdout,
                     level=logging.INFO,
@@ -10,19 +21,52 @@ logging.basicConfig(stream=sys.stdout,
 
 
 class Motherboard:
-    def __init__(self, boot_data, game_rom=None, testing: bool = True):
+    def __init__(self, boot_data, game_rom=None, testing: bool = True, renderer: str = 'auto'):
         self.ram = RAM()
+        self.mmu = MMU(self.ram.memory)
+        # Timers, PPU, DMA and interrupts hang their events off this timeline
+        self.scheduler = Scheduler()
+        self.interrupts = InterruptController(self)
+        self.dma = OAMDMA(self)
+        self.timer = Timer(self)
+        self.joypad = Joypad(self)
+        # 'numpy', 'python' or 'auto'
+        self.ppu = PPU(self, renderer)
         self.ram.load(boot_data, 0)
+        game_rom = game_rom if game_rom is not None else bytes(0x8000)
+        # Bank 0 is copied under the boot ROM, the switchable banks are mapped straight from the image
         self.ram.load(game_rom, 0x0000, start=0x0100, end=0x4000)
+        self.cartridge = load_cartridge(game_rom, self.mmu)
+        self.boot_rom_mapped = True
+        self.mmu.register_io(BOOT_ROM_OFF, write=self.write_boot_rom_off)
 
         if testing:
             self.run_test_items()
 
+    @property
+    def rom_bank(self):
+        # Bank mapped at 0x4000-0x7FFF
+        return self.cartridge.rom_bank
+
+    def write_boot_rom_off(self, address, value):
+        self.ram.memory[address] = value
+        if not value or not self.boot_rom_mapped:
+            return
+
+        # Put the cartridge's header page (interrupt and RST vectors) back over the boot ROM
+        self.boot_rom_mapped = False
+        self.ram.load_region(0, self.cartridge.rom_banks[0][:BOOT_ROM_END])
+        self.cartridge.map_rom0()
+        logging.info("Boot ROM unmapped")
+
+    def close(self):
+        self.cartridge.close()
+
     def get_byte(self, address):
-        return self.ram.read_byte(address)
+        return self.mmu.read(address)
 
     def set_byte(self, address, value):
-        return self.ram.set_byte(address, value)
+        self.mmu.write(address, value)
 
     def run_test_items(self):
         print(self.ram.read_byte(0))
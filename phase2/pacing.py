@@ -0,0 +1,91 @@
+import time
+
+from phase2.cpu import FRAME_RATE
+
+# Multipliers the turbo toggle steps through, None runs unthrottled
+TURBO_SPEEDS = (1, 2, 4, None)
+
+# Sleep until this close to the deadline, then spin: sleep() alone can overshoot by a millisecond or more
+SPIN_TIME = 0.002
+# Further behind than this and the pacer starts over instead of bursting frames to catch up
+MAX_LAG = 0.25
+
+
+class Pacer:
+    """
+    Holds a frame loop to the Game Boy's 59.73 fps of wall time, times the turbo multiplier: the
+    loop calls wait() after every frame it runs.
+
+    Deadlines are absolute on the monotonic clock (each frame is due one frame time after the
+    previous deadline, not after it finished), so the rate doesn't drift with frame time jitter.
+
+    Turbo may be changed from another thread (the front-end): set_turbo only records the request,
+    the pacing state is owned by the thread calling wait, which picks the new speed up next frame.
+    """
+
+    def __init__(self, turbo=1, clock=time.monotonic):
+        self.clock = clock
+        # Requested speed, the only field other threads write
+        self.turbo = None
+        # Speed the current deadline was set at
+        self.pacing_turbo = None
+        self.next_frame = None
+        # Times it fell over MAX_LAG behind and started pacing afresh
+        self.resyncs = 0
+        self.set_turbo(turbo)
+
+    def set_turbo(self, turbo):
+        """
+        :param turbo: speed multiplier, None for unlimited
+        """
+        if turbo is not None and turbo <= 0:
+            raise ValueError(f"Turbo must be positive or None: {turbo}")
+
+        self.turbo = turbo
+
+    def cycle_turbo(self):
+        """
+        1x -> 2x -> 4x -> unlimited -> 1x
+
+        :return: the new multiplier
+        """
+        turbo = self.turbo
+        index = TURBO_SPEEDS.index(turbo) if turbo in TURBO_SPEEDS else -1
+        turbo = TURBO_SPEEDS[(index + 1) % len(TURBO_SPEEDS)]
+        self.set_turbo(turbo)
+        return turbo
+
+    @staticmethod
+    def frame_time(turbo):
+        return None if turbo is None else 1 / (FRAME_RATE * turbo)
+
+    def wait(self):
+        """
+        Sleeps, then spins, until the current frame is due.
+        """
+        # Read the requested speed once, it can change under us
+        turbo = self.turbo
+        frame_time = self.frame_time(turbo)
+        if frame_time is None:
+            self.next_frame = None
+            return
+
+        now = self.clock()
+        next_frame = self.next_frame
+        if next_frame is None or turbo != self.pacing_turbo:
+            # First frame, or a new speed: start pacing afresh from here
+            next_frame = now
+            self.pacing_turbo = turbo
+        next_frame += frame_time
+
+        remaining = next_frame - now
+        if remaining < -MAX_LAG:
+            self.resyncs += 1
+            self.next_frame = now
+            return
+        self.next_frame = next_frame
+
+        if remaining > SPIN_TIME:
+            time.sleep(remaining - SPIN_TIME)
+        while self.clock() < next_frame:
+            pass
@@ -5,26 +5,60 @@ logging.basicConfig(stream=sys.stdout,
                     level=logging.INFO,
                     format='[%(asctime)s] {%(filename)s:%(lineno)d} %(levelname)s - %(message)s')
 
+MEMORY_SIZE = 0x10000
+
 
 class RAM:
     def __init__(self):
-        self.memory = bytearray([0] * 65536)
-        logging.info(f"Initialized Memory: {self.memory[:100]}")
+        # Zero filled in C, no intermediate list
+        self.memory = bytearray(MEMORY_SIZE)
+        self.view = memoryview(self.memory)
+        logging.debug(f"Initialized Memory: {MEMORY_SIZE} bytes")
 
     def load(self, data, offset, start=0, end=0xFFFF):
-        for i in range(max(0, start), min(len(data), end)):
-            self.memory[int(i + offset)] = data[i]
-            # logging.info(f"address: {int(i + offset)} - {data[i]}")
+        """
+        Copies data[start:end] to `offset + start` in one slice assignment, clipped to the data and
+        to the address space.
+        """
+        start = max(0, start)
+        end = min(len(data), end, MEMORY_SIZE - offset)
+        if end <= start:
+            return
+
+        self.view[start + offset:end + offset] = memoryview(data)[start:end]
+        logging.debug(f"Loaded Memory: {end - start} bytes at {start + offset:04X}")
+
+    # === Bulk access for DMA, cartridges and save states ===
+    def load_region(self, address, data):
+        """
+        Writes `data` (bytes, bytearray, memoryview, mmap) starting at `address`.
+        """
+        end = address + len(data)
+        if address < 0 or end > MEMORY_SIZE:
+            raise ValueError(f"Region {address:04X}-{end:04X} is outside the address space")
+
+        self.view[address:end] = data
 
-        logging.info(f"Loaded Memory: {self.memory[start:start+1000]}")
+    def fill(self, start, end, value=0):
+        """
+        Sets [start, end) to `value`.
+        """
+        self.view[start:end] = bytes([value]) * (end - start)
+
+    def copy_within(self, source, destination, length):
+        """
+        Copies `length` bytes from `source` to `destination`, overlapping ranges included.
+        """
+        if min(source, destination) < 0 or max(source, destination) + length > MEMORY_SIZE:
+            raise ValueError(f"Copy of {length} bytes {source:04X} -> {destination:04X} is outside the address space")
+
+        # memoryview to memoryview is a memmove, overlap is safe
+        self.view[destination:destination + length] = self.view[source:source + length]
 
     def read_byte(self, address):
         value = self.memory[address]
-        logging.info(f"Read byte: {value}")
-        value = int.to_bytes(value, 1, 'little')
-
-        logging.info(f"Read byte return val: {value}")
-        return value
+        logging.debug(f"Read byte: {value}")
+        return int.to_bytes(value, 1, 'little')
 
     def set_byte(self, address, value):
         self.memory[address] = value
@@ -0,0 +1,65 @@
+NEVER = 1 << 62
+
+
+class Scheduler:
+    """
+    Global event timeline in T-cycles.
+
+    Every subsystem owns named slots ("ppu", "timer", "dma", ...) holding at most one pending
+    event each: "at cycle N, call X". Scheduling a name again replaces its event. The CPU keeps
+    ``cycles`` current and only compares it against ``deadline``, the earliest pending event,
+    so no subsystem is ticked per instruction.
+    """
+
+    def __init__(self):
+        self.cycles = 0
+        self.deadline = NEVER
+        self.next_event = None
+        self.events = {}
+        # Events fired so far, lets callers tell whether anything ran between two points in time
+        self.fired = 0
+
+    def schedule(self, name, cycle, callback):
+        """
+        Calls `callback(cycle)` once the clock reaches `cycle`. The callback gets the cycle it was
+        scheduled for, so periodic events can reschedule without drift even when run late.
+        """
+        self.events[name] = (cycle, callback)
+        if cycle < self.deadline:
+            self.deadline = cycle
+            self.next_event = name
+        elif name == self.next_event:
+            self.update_deadline()
+
+    def schedule_in(self, name, cycles, callback):
+        self.schedule(name, self.cycles + cycles, callback)
+
+    def cancel(self, name):
+        if self.events.pop(name, None) is not None and name == self.next_event:
+            self.update_deadline()
+
+    def pending(self, name):
+        """
+        :return: the cycle `name` is scheduled for, None if it isn't
+        """
+        event = self.events.get(name)
+        return None if event is None else event[0]
+
+    def update_deadline(self):
+        if self.events:
+            self.next_event = min(self.events, key=lambda name: self.events[name][0])
+            self.deadline = self.events[self.next_event][0]
+        else:
+            self.next_event = None
+            self.deadline = NEVER
+
+    def run_due(self):
+        """
+        Fires every event due at the current cycle, earliest first.
+        """
+        while self.deadline <= self.cycles:
+            name = self.next_event
+            cycle, callback = self.events.pop(name)
+            self.update_deadline()
+            self.fired += 1
+            callback(cycle)
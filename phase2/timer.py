@@ -0,0 +1,103 @@
+from phase2.interrupts import TIMER
+
+DIV = 0xFF04
+TIMA = 0xFF05
+TMA = 0xFF06
+TAC = 0xFF07
+
+# TAC bits 0-1 -> T-cycles per TIMA increment
+PERIODS = (1024, 16, 64, 256)
+TIMER_ENABLE = 0x04
+
+
+class Timer:
+    """
+    DIV/TIMA/TMA/TAC computed from the scheduler's clock instead of being ticked per instruction.
+
+    DIV is the top byte of a 16-bit counter running since the last DIV write, so it is derived on
+    read. TIMA counts how often that counter crossed a multiple of the TAC period; its value is
+    brought up to date only when it is read or the timer is reconfigured, and the overflow is one
+    "timer" event scheduled for the exact cycle TIMA wraps, which reloads TMA and requests the interrupt.
+    """
+
+    def __init__(self, motherboard):
+        self.memory = motherboard.ram.memory
+        self.scheduler = motherboard.scheduler
+        self.interrupts = motherboard.interrupts
+
+        # Cycle the internal counter was last reset (DIV write)
+        self.div_base = 0
+        # TIMA as of tima_cycle
+        self.tima = 0
+        self.tima_cycle = 0
+        self.memory[TAC] = 0xF8
+
+        mmu = motherboard.mmu
+        mmu.register_io(DIV, read=self.read_div, write=self.write_div)
+        mmu.register_io(TIMA, read=self.read_tima, write=self.write_tima)
+        mmu.register_io(TAC, write=self.write_tac)
+
+    @property
+    def enabled(self):
+        return self.memory[TAC] & TIMER_ENABLE
+
+    @property
+    def period(self):
+        return PERIODS[self.memory[TAC] & 0x03]
+
+    def sync(self, cycle):
+        """
+        Adds the increments since tima_cycle.
+        """
+        if self.enabled:
+            period = self.period
+            ticks = (cycle - self.div_base) // period - (self.tima_cycle - self.div_base) // period
+            tima = self.tima + ticks
+            if tima > 0xFF:
+                # Only reachable when read between the overflow cycle and its event
+                tma = self.memory[TMA]
+                tima = tma + (tima - 0x100) % (0x100 - tma)
+            self.tima = tima
+        self.tima_cycle = cycle
+
+    def schedule_overflow(self):
+        if not self.enabled:
+            self.scheduler.cancel('timer')
+            return
+
+        period = self.period
+        counter = self.tima_cycle - self.div_base
+        ticks = 0x100 - self.tima
+        self.scheduler.schedule('timer', self.div_base + (counter // period + ticks) * period, self.overflow)
+
+    def overflow(self, cycle):
+        self.tima = self.memory[TMA]
+        self.tima_cycle = cycle
+        self.interrupts.request(TIMER)
+        self.schedule_overflow()
+
+    # === Registers ===
+    def read_div(self, address):
+        return ((self.scheduler.cycles - self.div_base) >> 8) & 0xFF
+
+    def write_div(self, address, value):
+        # Any write clears the whole counter, which also restarts the current TIMA period
+        now = self.scheduler.cycles
+        self.sync(now)
+        self.div_base = now
+        self.schedule_overflow()
+
+    def read_tima(self, address):
+        self.sync(self.scheduler.cycles)
+        return self.tima
+
+    def write_tima(self, address, value):
+        now = self.scheduler.cycles
+        self.sync(now)
+        self.tima = value
+        self.schedule_overflow()
+
+    def write_tac(self, address, value):
+        self.sync(self.scheduler.cycles)
+        self.memory[TAC] = value | 0xF8
+        self.schedule_overflow()
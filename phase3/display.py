@@ -1,39 +1,73 @@
-from pyxel import *
+import ctypes
 
+import pyxel
+
+from phase3.emulation import EmulationThread
+from phase3.framebuffer import FRAME_SIZE
+from phase3.renderer import SCREEN_WIDTH, SCREEN_HEIGHT
 from phase4.inputs import *
 
+# Palette slots 0-3 show the PPU's shades 0 (lightest) to 3, so frames need no colour conversion
+SHADE_COLOURS = (0xE0F8D0, 0x88C070, 0x346856, 0x081820)
+# Shade -> hex digit, for Image.set when the pixel pointer isn't available
+SHADE_DIGITS = bytes.maketrans(bytes(range(4)), b'0123')
+
+# pyxel button -> input code forwarded to the emulation thread
+BUTTONS = {
+    pyxel.GAMEPAD1_BUTTON_A: A,
+    pyxel.GAMEPAD1_BUTTON_B: B,
+    pyxel.GAMEPAD1_BUTTON_START: start,
+    pyxel.GAMEPAD1_BUTTON_BACK: select,
+    pyxel.GAMEPAD1_BUTTON_DPAD_DOWN: down,
+    pyxel.GAMEPAD1_BUTTON_DPAD_UP: up,
+    pyxel.GAMEPAD1_BUTTON_DPAD_LEFT: left,
+    pyxel.GAMEPAD1_BUTTON_DPAD_RIGHT: right,
+}
+
 
 class Interface:
     def __init__(self, cpu, mb):
-        init(160, 144)
+        pyxel.init(SCREEN_WIDTH, SCREEN_HEIGHT, fps=60)
         self.cpu = cpu
         self.mb = mb
 
-        run(self.update, self.draw)
+        # pyxel.colors only exists once init has run
+        for shade, colour in enumerate(SHADE_COLOURS):
+            pyxel.colors[shade] = colour
 
-    def update(self):
+        self.screen = pyxel.Image(SCREEN_WIDTH, SCREEN_HEIGHT)
+        # The image's own pixel memory, frames are copied straight into it
+        self.pixels = self.screen.data_ptr() if hasattr(self.screen, 'data_ptr') else None
 
-        self.cpu.execute()
-
-        if btnp(GAMEPAD1_BUTTON_A):
-            print(A())
-        if btnp(GAMEPAD1_BUTTON_B):
-            print(B())
-        if btnp(GAMEPAD1_BUTTON_START):
-            print(start())
-        if btnp(GAMEPAD1_BUTTON_BACK):
-            print(select())
-        if btnp(GAMEPAD1_BUTTON_DPAD_DOWN):
-            print(down())
-        if btnp(GAMEPAD1_BUTTON_DPAD_UP):
-            print(up())
-        if btnp(GAMEPAD1_BUTTON_DPAD_LEFT):
-            print(left())
-        if btnp(GAMEPAD1_BUTTON_DPAD_RIGHT):
-            print(right())
+        # The core runs on its own thread, pyxel's callbacks only show frames and forward input
+        self.emulation = EmulationThread(cpu)
+        self.emulation.start()
 
+        pyxel.run(self.update, self.draw)
+
+    def update(self):
+        if pyxel.btnp(pyxel.KEY_TAB):
+            print(f"Turbo: {self.emulation.pacer.cycle_turbo() or 'unlimited'}")
+
+        for button, code in BUTTONS.items():
+            if pyxel.btnp(button):
+                self.emulation.send_input(code(), True)
+            if pyxel.btnr(button):
+                self.emulation.send_input(code(), False)
 
     def draw(self):
-        cls(0)
-        # pyxel.line()
-    # == add inputs below
+        frame = self.emulation.latest_frame()
+        if frame is not None:
+            self.present(frame)
+            self.emulation.recycle(frame)
+        pyxel.blt(0, 0, self.screen, 0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    def present(self, frame):
+        """
+        Copies a frame into the screen image in one bulk call.
+        """
+        if self.pixels is not None:
+            ctypes.memmove(self.pixels, (ctypes.c_char * FRAME_SIZE).from_buffer(frame), FRAME_SIZE)
+        else:
+            text = frame.translate(SHADE_DIGITS).decode('ascii')
+            self.screen.set(0, 0, [text[y * SCREEN_WIDTH:(y + 1) * SCREEN_WIDTH] for y in range(SCREEN_HEIGHT)])
@@ -0,0 +1,133 @@
+import logging
+import queue
+import sys
+import threading
+import time
+
+from phase2.pacing import Pacer
+from phase3.framebuffer import FRAME_SIZE
+
+logging.basicConfig(stream=sys.stdout,
+                    level=logging.INFO,
+                    format='[%(asctime)s] {%(filename)s:%(lineno)d} %(levelname)s - %(message)s')
+
+
+class EmulationThread(threading.Thread):
+    """
+    Runs the CPU frame after frame on its own thread, independent of the front-end's callbacks,
+    paced to 59.73 fps times ``pacer.turbo`` (None, unlimited, for measuring the core).
+
+    Every completed frame is copied into a small bounded queue. When the front-end falls behind
+    the oldest queued frame is dropped instead of blocking, so emulation speed never depends on
+    drawing; the front-end takes only the newest frame and forwards input back through a second
+    queue that is drained between frames.
+
+    Frames are copied into a fixed pool of buffers, not new ones: the front-end hands each frame
+    back with ``recycle`` once it has shown it, and dropped or skipped frames go straight back.
+    """
+
+    def __init__(self, cpu, queue_size: int = 2, turbo=1):
+        super().__init__(name='emulation', daemon=True)
+        self.cpu = cpu
+        self.framebuffer = cpu.motherboard.ppu.framebuffer
+        # Turbo can be changed from the front-end while running
+        self.pacer = Pacer(turbo)
+
+        self.frames = queue.Queue(maxsize=queue_size)
+        # Enough for a full queue, the frame on screen and the one being copied
+        self.spare_frames = queue.SimpleQueue()
+        for _ in range(queue_size + 2):
+            self.spare_frames.put(bytearray(FRAME_SIZE))
+        self.inputs = queue.SimpleQueue()
+        # Forwarded input lands in the joypad register, only ever between frames
+        self.joypad = cpu.motherboard.joypad
+        self.stopping = threading.Event()
+
+        self.frames_run = 0
+        # Only ever written by this thread, when the queue overflows
+        self.frames_dropped = 0
+        self.started_at = None
+
+    def run(self):
+        self.started_at = time.perf_counter()
+        published = self.framebuffer.frame_number
+        while not self.stopping.is_set():
+            self.apply_inputs()
+            self.cpu.run_frame()
+            self.frames_run += 1
+
+            # Nothing new while the LCD is off
+            if self.framebuffer.frame_number != published:
+                frame, published = self.framebuffer.copy_front(self.spare_frame())
+                self.publish(frame)
+
+            self.pacer.wait()
+
+    def publish(self, frame):
+        try:
+            self.frames.put_nowait(frame)
+        except queue.Full:
+            # Front-end is behind: drop its oldest frame rather than wait for it
+            try:
+                self.recycle(self.frames.get_nowait())
+                self.frames_dropped += 1
+            except queue.Empty:
+                pass
+            self.frames.put_nowait(frame)
+
+    def latest_frame(self):
+        """
+        Front-end side: the newest queued frame, skipping older ones, or None if there is none.
+        """
+        frame = None
+        while True:
+            try:
+                newer = self.frames.get_nowait()
+            except queue.Empty:
+                return frame
+            if frame is not None:
+                self.recycle(frame)
+            frame = newer
+
+    def recycle(self, frame):
+        """
+        Front-end side: returns a frame from ``latest_frame`` to the pool once it has been shown.
+        """
+        self.spare_frames.put(frame)
+
+    def spare_frame(self):
+        try:
+            return self.spare_frames.get_nowait()
+        except queue.Empty:
+            # Only if the front-end holds on to frames without recycling them
+            return bytearray(FRAME_SIZE)
+
+    def send_input(self, code, pressed: bool = True):
+        self.inputs.put((code, pressed))
+
+    def apply_inputs(self):
+        while True:
+            try:
+                code, pressed = self.inputs.get_nowait()
+            except queue.Empty:
+                return
+            if pressed:
+                self.joypad.press(code)
+            else:
+                self.joypad.release(code)
+            logging.debug(f"Input {code} {'down' if pressed else 'up'}")
+
+    def stop(self):
+        self.stopping.set()
+        if self.is_alive():
+            self.join()
+
+    def stats(self):
+        elapsed = time.perf_counter() - self.started_at if self.started_at else 0
+        return {
+            'frames_run': self.frames_run,
+            'frames_dropped': self.frames_dropped,
+            'emulated_fps': self.frames_run / elapsed if elapsed else 0.0,
+            'turbo': self.pacer.turbo,
+            'pacer_resyncs': self.pacer.resyncs,
+        }
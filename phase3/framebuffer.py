@@ -0,0 +1,39 @@
+import threading
+
+from phase3.renderer import SCREEN_WIDTH, SCREEN_HEIGHT
+
+FRAME_SIZE = SCREEN_WIDTH * SCREEN_HEIGHT
+
+
+class FrameBuffer:
+    """
+    Two preallocated 160x144 shade buffers (one byte per pixel, 0 white .. 3 black).
+
+    The PPU renders into ``back``; at VBlank ``swap`` publishes it as ``front`` and hands the old
+    front back for the next frame. Swapping only exchanges references, so the emulator never
+    waits for a reader: the display copies ``front`` out under the lock in one bulk copy.
+    """
+
+    def __init__(self):
+        self.back = bytearray(FRAME_SIZE)
+        self.front = bytearray(FRAME_SIZE)
+        # Completed frames, lets readers tell a new frame from one they already showed
+        self.frame_number = 0
+        self.lock = threading.Lock()
+
+    def swap(self):
+        with self.lock:
+            self.back, self.front = self.front, self.back
+            self.frame_number += 1
+
+    def copy_front(self, destination=None):
+        """
+        Copies the latest complete frame into `destination` (any writable buffer), or a new bytearray.
+
+        :return: (destination, frame number)
+        """
+        with self.lock:
+            if destination is None:
+                return bytearray(self.front), self.frame_number
+            memoryview(destination).cast('B')[:FRAME_SIZE] = self.front
+            return destination, self.frame_number
@@ -0,0 +1,144 @@
+import numpy as np
+
+from phase3.renderer import (SCREEN_WIDTH, SCREEN_HEIGHT, LCDC, SCY, SCX, BGP, OBP0, OBP1, WY, WX, BG_ENABLE,
+                             OBJ_ENABLE, OBJ_SIZE, BG_MAP, TILE_DATA, WINDOW_ENABLE, WINDOW_MAP, palette,
+                             PythonRenderer)
+from phase3.sprites import sprite_row, BG_PRIORITY, PALETTE_1
+from phase3.tile_cache import TILE_COUNT
+
+# Palette register -> shade of each colour index
+SHADES = np.array([palette(value) for value in range(0x100)], dtype=np.uint8)
+
+# Sprite layer indexed by sprite X (screen x + 8), wide enough for X up to 255 plus 8 pixels
+SPRITE_LAYER_WIDTH = 0x100 + 8
+
+
+class NumpyRenderer(PythonRenderer):
+    """
+    Background and window composed with NumPy fancy indexing over the tile cache, sprites with
+    vectorised masks over the line, no per-pixel Python.
+
+    ``render_line`` does one scanline for the PPU; ``render_frame`` does all 144 lines in one
+    go from the current registers. Output is identical to PythonRenderer, which stays the reference.
+    """
+
+    def __init__(self, memory, tile_cache):
+        super().__init__(memory, tile_cache)
+        # Views, not copies: they follow memory and the cache as they change
+        self.vram = np.frombuffer(memory, dtype=np.uint8)
+        self.tiles = np.frombuffer(tile_cache.tiles, dtype=np.uint8).reshape(TILE_COUNT, 8, 8)
+        self.tile_pixels = self.tiles.reshape(-1)
+        self.line_array = np.frombuffer(self.line, dtype=np.uint8)
+
+        self.columns = np.arange(SCREEN_WIDTH)
+        self.rows = np.arange(SCREEN_HEIGHT)
+
+        self.sprite_opaque = np.zeros(SPRITE_LAYER_WIDTH, dtype=bool)
+        self.sprite_shades = np.zeros(SPRITE_LAYER_WIDTH, dtype=np.uint8)
+        self.sprite_behind = np.zeros(SPRITE_LAYER_WIDTH, dtype=bool)
+
+    @staticmethod
+    def tile_indices(entries, lcdc):
+        # 0x8000 addressing with unsigned indices, or 0x9000 with signed ones
+        if lcdc & TILE_DATA:
+            return entries
+        return 256 + entries.view(np.int8).astype(np.intp)
+
+    def tile_map(self, lcdc, bit):
+        base = 0x9C00 if lcdc & bit else 0x9800
+        return self.vram[base:base + 0x400].reshape(32, 32)
+
+    def render_line(self, ly, frame):
+        memory = self.memory
+        lcdc = memory[LCDC]
+        self.tile_cache.update()
+
+        if lcdc & BG_ENABLE:
+            y = (ly + memory[SCY]) & 0xFF
+            row = self.tiles[self.tile_indices(self.tile_map(lcdc, BG_MAP)[y >> 3], lcdc), y & 7].reshape(256)
+            line = row[(self.columns + memory[SCX]) & 0xFF]
+
+            wx = memory[WX] - 7
+            if lcdc & WINDOW_ENABLE and ly >= memory[WY] and wx < SCREEN_WIDTH:
+                window_y = self.window_line
+                window_row = self.tiles[self.tile_indices(self.tile_map(lcdc, WINDOW_MAP)[window_y >> 3], lcdc),
+                                        window_y & 7].reshape(256)
+                start = max(wx, 0)
+                line[start:] = window_row[start - wx:SCREEN_WIDTH - wx]
+                self.window_line += 1
+
+            self.line_array[:] = line
+            np.frombuffer(frame, dtype=np.uint8)[ly * SCREEN_WIDTH:(ly + 1) * SCREEN_WIDTH] = SHADES[memory[BGP]][line]
+        else:
+            # DMG: background and window off is a blank line, sprites still show
+            self.line_array[:] = 0
+            np.frombuffer(frame, dtype=np.uint8)[ly * SCREEN_WIDTH:(ly + 1) * SCREEN_WIDTH] = 0
+
+        if lcdc & OBJ_ENABLE:
+            self.draw_sprites(ly, lcdc, frame)
+
+    def draw_sprites(self, ly, lcdc, frame):
+        height = 16 if lcdc & OBJ_SIZE else 8
+        self.sprites.update(height)
+        sprites = self.sprites.lines[ly]
+        if not sprites:
+            return
+
+        palettes = (SHADES[self.memory[OBP0]], SHADES[self.memory[OBP1]])
+        opaque = self.sprite_opaque
+        shades = self.sprite_shades
+        behind = self.sprite_behind
+        opaque[:] = False
+
+        # Lowest priority first, so the winner of every pixel is written last
+        for x, _, top, tile, attributes in sprites:
+            pixels = sprite_row(self.tile_pixels, tile, ly - top, attributes, height)
+            mask = pixels != 0
+            span = slice(x, x + 8)
+            opaque[span] |= mask
+            np.copyto(shades[span], palettes[bool(attributes & PALETTE_1)][pixels], where=mask)
+            np.copyto(behind[span], bool(attributes & BG_PRIORITY), where=mask)
+
+        visible = opaque[8:8 + SCREEN_WIDTH] & ~(behind[8:8 + SCREEN_WIDTH] & (self.line_array != 0))
+        output = np.frombuffer(frame, dtype=np.uint8)[ly * SCREEN_WIDTH:(ly + 1) * SCREEN_WIDTH]
+        output[visible] = shades[8:8 + SCREEN_WIDTH][visible]
+
+    def render_frame(self, frame):
+        """
+        Whole frame from the current registers, as if none of them changed mid-frame.
+        """
+        memory = self.memory
+        lcdc = memory[LCDC]
+        output = np.frombuffer(frame, dtype=np.uint8).reshape(SCREEN_HEIGHT, SCREEN_WIDTH)
+        self.start_frame()
+        self.tile_cache.update()
+
+        if lcdc & BG_ENABLE:
+            ys = ((self.rows + memory[SCY]) & 0xFF)[:, None]
+            xs = ((self.columns + memory[SCX]) & 0xFF)[None, :]
+            entries = self.tile_map(lcdc, BG_MAP)[ys >> 3, xs >> 3]
+            pixels = self.tiles[self.tile_indices(entries, lcdc), ys & 7, xs & 7]
+
+            wy = memory[WY]
+            wx = memory[WX] - 7
+            if lcdc & WINDOW_ENABLE and wy < SCREEN_HEIGHT and wx < SCREEN_WIDTH:
+                start = max(wx, 0)
+                window_ys = np.arange(SCREEN_HEIGHT - wy)[:, None]
+                window_xs = (np.arange(start, SCREEN_WIDTH) - wx)[None, :]
+                entries = self.tile_map(lcdc, WINDOW_MAP)[window_ys >> 3, window_xs >> 3]
+                pixels[wy:, start:] = self.tiles[self.tile_indices(entries, lcdc), window_ys & 7, window_xs & 7]
+                self.window_line = SCREEN_HEIGHT - wy
+
+            output[:] = SHADES[memory[BGP]][pixels]
+        else:
+            pixels = np.zeros((SCREEN_HEIGHT, SCREEN_WIDTH), dtype=np.uint8)
+            output[:] = 0
+
+        if lcdc & OBJ_ENABLE:
+            self.sprites.update(16 if lcdc & OBJ_SIZE else 8)
+            for ly in range(SCREEN_HEIGHT):
+                if self.sprites.lines[ly]:
+                    self.line_array[:] = pixels[ly]
+                    self.draw_sprites(ly, lcdc, frame)
+
+        self.line_array[:] = pixels[-1]
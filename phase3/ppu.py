@@ -0,0 +1,198 @@
+from phase2.interrupts import VBLANK, LCD_STAT
+from phase3.framebuffer import FrameBuffer
+from phase3.renderer import SCREEN_HEIGHT, LCDC, create_renderer
+from phase3.tile_cache import TileCache
+
+STAT = 0xFF41
+LY = 0xFF44
+LYC = 0xFF45
+
+LCD_ENABLE = 0x80
+
+LINE_CYCLES = 456
+OAM_SCAN_CYCLES = 80
+TRANSFER_CYCLES = 172
+HBLANK_CYCLES = LINE_CYCLES - OAM_SCAN_CYCLES - TRANSFER_CYCLES
+LINES_PER_FRAME = 154
+
+MODE_HBLANK = 0
+MODE_VBLANK = 1
+MODE_OAM_SCAN = 2
+MODE_TRANSFER = 3
+
+# STAT interrupt sources, indexed by mode (mode 3 has none)
+MODE_SOURCES = (0x08, 0x10, 0x20, 0x00)
+LYC_SOURCE = 0x40
+LYC_EQUAL = 0x04
+
+
+class PPU:
+    """
+    Scanline PPU on the event timeline.
+
+    Each visible line is three "ppu" events: OAM scan (mode 2), transfer (mode 3) and HBlank (mode 0),
+    the line being rendered in one go as mode 3 ends. Lines 144-153 are VBlank (mode 1), one event
+    each. LY, LYC and STAT live in I/O memory and are updated at those events, so reads cost nothing
+    and scroll registers changed mid-frame take effect on the next line.
+
+    Timing, STAT and interrupts never depend on drawing, so pixels can be skipped without the game
+    noticing: with ``frameskip`` N only every Nth frame is composed, and with ``render_on_demand``
+    a frame is only composed after ``request_frame`` (or ``render_now``) asks for one.
+    """
+
+    def __init__(self, motherboard, renderer='auto'):
+        self.memory = motherboard.ram.memory
+        self.scheduler = motherboard.scheduler
+        self.interrupts = motherboard.interrupts
+
+        self.framebuffer = FrameBuffer()
+        self.tile_cache = TileCache(motherboard)
+        self.renderer = create_renderer(self.memory, self.tile_cache, renderer)
+        self.frames = 0
+        self.frames_rendered = 0
+
+        # Compose 1 of every `frameskip` frames, or only the ones asked for
+        self._frameskip = 1
+        self.render_on_demand = False
+        self.frame_requested = False
+        # Whether the frame in progress is being composed
+        self.rendering = False
+
+        # OR of the enabled STAT sources, the interrupt fires on its rising edge
+        self.stat_line = False
+        self.memory[STAT] = 0x80
+
+        mmu = motherboard.mmu
+        mmu.register_io(LCDC, write=self.write_lcdc)
+        mmu.register_io(STAT, write=self.write_stat)
+        mmu.register_io(LY, write=self.write_ly)
+        mmu.register_io(LYC, write=self.write_lyc)
+
+        if self.memory[LCDC] & LCD_ENABLE:
+            self.start_line(self.scheduler.cycles)
+
+    @property
+    def frame(self):
+        # Last complete frame
+        return self.framebuffer.front
+
+    # === Line events ===
+    def start_line(self, cycle):
+        ly = self.memory[LY]
+        self.compare_lyc()
+        if ly < SCREEN_HEIGHT:
+            if ly == 0:
+                self.start_frame()
+            self.set_mode(MODE_OAM_SCAN)
+            self.scheduler.schedule('ppu', cycle + OAM_SCAN_CYCLES, self.start_transfer)
+        else:
+            if ly == SCREEN_HEIGHT:
+                self.set_mode(MODE_VBLANK)
+                if self.rendering:
+                    self.framebuffer.swap()
+                    self.frames_rendered += 1
+                    self.rendering = False
+                self.frames += 1
+                self.interrupts.request(VBLANK)
+            else:
+                self.update_stat()
+            self.scheduler.schedule('ppu', cycle + LINE_CYCLES, self.next_line)
+
+    @property
+    def frameskip(self):
+        return self._frameskip
+
+    @frameskip.setter
+    def frameskip(self, frameskip):
+        if frameskip < 1:
+            raise ValueError(f"Frameskip must be at least 1: {frameskip}")
+        self._frameskip = frameskip
+
+    def start_frame(self):
+        if self.render_on_demand:
+            self.rendering = self.frame_requested
+            self.frame_requested = False
+        else:
+            self.rendering = self.frames % self._frameskip == 0
+        if self.rendering:
+            self.renderer.start_frame()
+
+    def request_frame(self):
+        """
+        Render-on-demand: composes the next full frame, line by line as usual. It is in
+        ``frame``/``framebuffer`` once the framebuffer's frame number moves on.
+        """
+        self.frame_requested = True
+
+    def render_now(self):
+        """
+        Composes a frame straight away from the current VRAM and registers (no mid-frame effects).
+
+        :return: the frame
+        """
+        self.renderer.render_frame(self.framebuffer.back)
+        self.framebuffer.swap()
+        self.frames_rendered += 1
+        return self.framebuffer.front
+
+    def start_transfer(self, cycle):
+        self.set_mode(MODE_TRANSFER)
+        self.scheduler.schedule('ppu', cycle + TRANSFER_CYCLES, self.start_hblank)
+
+    def start_hblank(self, cycle):
+        if self.rendering:
+            self.renderer.render_line(self.memory[LY], self.framebuffer.back)
+        self.set_mode(MODE_HBLANK)
+        self.scheduler.schedule('ppu', cycle + HBLANK_CYCLES, self.next_line)
+
+    def next_line(self, cycle):
+        self.memory[LY] = (self.memory[LY] + 1) % LINES_PER_FRAME
+        self.start_line(cycle)
+
+    # === STAT ===
+    def set_mode(self, mode):
+        self.memory[STAT] = (self.memory[STAT] & 0xFC) | mode
+        self.update_stat()
+
+    def compare_lyc(self):
+        if self.memory[LY] == self.memory[LYC]:
+            self.memory[STAT] |= LYC_EQUAL
+        else:
+            self.memory[STAT] &= ~LYC_EQUAL & 0xFF
+
+    def update_stat(self):
+        stat = self.memory[STAT]
+        line = bool(stat & MODE_SOURCES[stat & 0x03]) or bool(stat & LYC_SOURCE and stat & LYC_EQUAL)
+        if line and not self.stat_line:
+            self.interrupts.request(LCD_STAT)
+        self.stat_line = line
+
+    # === Registers ===
+    def write_lcdc(self, address, value):
+        was_on = self.memory[LCDC] & LCD_ENABLE
+        self.memory[LCDC] = value
+        if was_on and not value & LCD_ENABLE:
+            # Off: LY parks at 0 in HBlank until the LCD comes back
+            self.scheduler.cancel('ppu')
+            self.memory[LY] = 0
+            # LY moved, so the coincidence bit and the STAT line follow (set_mode updates the line)
+            self.compare_lyc()
+            self.set_mode(MODE_HBLANK)
+        elif value & LCD_ENABLE and not was_on:
+            self.memory[LY] = 0
+            self.start_line(self.scheduler.cycles)
+
+    def write_stat(self, address, value):
+        # Only the interrupt source bits are writable
+        self.memory[STAT] = 0x80 | (value & 0x78) | (self.memory[STAT] & 0x07)
+        self.update_stat()
+
+    def write_ly(self, address, value):
+        # Read only
+        pass
+
+    def write_lyc(self, address, value):
+        self.memory[LYC] = value
+        if self.memory[LCDC] & LCD_ENABLE:
+            self.compare_lyc()
+            self.update_stat()
@@ -0,0 +1,153 @@
+from phase3.sprites import SpriteIndex, sprite_row, BG_PRIORITY, PALETTE_1
+
+SCREEN_WIDTH = 160
+SCREEN_HEIGHT = 144
+
+LCDC = 0xFF40
+SCY = 0xFF42
+SCX = 0xFF43
+BGP = 0xFF47
+OBP0 = 0xFF48
+OBP1 = 0xFF49
+WY = 0xFF4A
+WX = 0xFF4B
+
+# LCDC bits
+BG_ENABLE = 0x01
+OBJ_ENABLE = 0x02
+OBJ_SIZE = 0x04
+BG_MAP = 0x08
+TILE_DATA = 0x10
+WINDOW_ENABLE = 0x20
+WINDOW_MAP = 0x40
+
+
+def palette(value):
+    """
+    BGP/OBP register -> shade (0 white .. 3 black) of each of the 4 colour indices.
+    """
+    return [(value >> (2 * index)) & 0x03 for index in range(4)]
+
+
+def tile_index(tile, lcdc):
+    # Cache index of a tile map entry: 0x8000 addressing with unsigned indices, or 0x9000 with signed ones
+    if lcdc & TILE_DATA:
+        return tile
+    return 256 + ((tile ^ 0x80) - 0x80)
+
+
+def shade_table(value):
+    """
+    Palette register -> ``bytes.translate`` table mapping colour indices to shades.
+    """
+    return bytes(palette(value)) + bytes(252)
+
+
+class PythonRenderer:
+    """
+    Reference scanline renderer, background, window and sprites, no dependencies.
+
+    Tile rows come pre-decoded from the tile cache, so a line is 32 slices of the cache joined into
+    the 256 pixel map row, rotated by SCX and pushed through the palette with ``bytes.translate``.
+    The line's colour indices are kept in `line` for sprite priority; `frame` gets the shades.
+    """
+
+    def __init__(self, memory, tile_cache):
+        self.memory = memory
+        self.tile_cache = tile_cache
+        self.line = bytearray(SCREEN_WIDTH)
+        self.sprites = SpriteIndex(memory, SCREEN_HEIGHT)
+        # The window has its own line counter, it only advances on lines it was drawn on
+        self.window_line = 0
+
+    def start_frame(self):
+        self.window_line = 0
+
+    def render_frame(self, frame):
+        """
+        Whole frame from the current registers, as if none of them changed mid-frame.
+        """
+        self.start_frame()
+        for ly in range(SCREEN_HEIGHT):
+            self.render_line(ly, frame)
+
+    def render_line(self, ly, frame):
+        memory = self.memory
+        lcdc = memory[LCDC]
+        row = ly * SCREEN_WIDTH
+        self.tile_cache.update()
+
+        if lcdc & BG_ENABLE:
+            scx = memory[SCX]
+            map_row = self.map_row(0x9C00 if lcdc & BG_MAP else 0x9800, (ly + memory[SCY]) & 0xFF, lcdc)
+            line = (map_row[scx:] + map_row[:scx])[:SCREEN_WIDTH]
+
+            wx = memory[WX] - 7
+            if lcdc & WINDOW_ENABLE and ly >= memory[WY] and wx < SCREEN_WIDTH:
+                window_row = self.map_row(0x9C00 if lcdc & WINDOW_MAP else 0x9800, self.window_line, lcdc)
+                start = max(wx, 0)
+                line = line[:start] + window_row[start - wx:SCREEN_WIDTH - wx]
+                self.window_line += 1
+
+            self.line[:] = line
+            frame[row:row + SCREEN_WIDTH] = line.translate(shade_table(memory[BGP]))
+        else:
+            # DMG: background and window off is a blank line, sprites still show
+            self.line[:] = bytes(SCREEN_WIDTH)
+            frame[row:row + SCREEN_WIDTH] = self.line
+
+        if lcdc & OBJ_ENABLE:
+            self.draw_sprites(ly, lcdc, frame)
+
+    def draw_sprites(self, ly, lcdc, frame):
+        height = 16 if lcdc & OBJ_SIZE else 8
+        self.sprites.update(height)
+        sprites = self.sprites.lines[ly]
+        if not sprites:
+            return
+
+        tiles = self.tile_cache.tiles
+        palettes = (palette(self.memory[OBP0]), palette(self.memory[OBP1]))
+
+        # Screen x -> (shade, behind background), the winner of each pixel is drawn last
+        layer = {}
+        for x, _, top, tile, attributes in sprites:
+            shades = palettes[bool(attributes & PALETTE_1)]
+            for i, colour in enumerate(sprite_row(tiles, tile, ly - top, attributes, height)):
+                screen_x = x - 8 + i
+                if colour and 0 <= screen_x < SCREEN_WIDTH:
+                    layer[screen_x] = (shades[colour], attributes & BG_PRIORITY)
+
+        row = ly * SCREEN_WIDTH
+        line = self.line
+        for screen_x, (shade, behind) in layer.items():
+            if not behind or not line[screen_x]:
+                frame[row + screen_x] = shade
+
+    def map_row(self, map_base, map_y, lcdc):
+        """
+        Colour indices of one 256 pixel row of a 32x32 tile map.
+        """
+        tiles = self.tile_cache.tiles
+        row_offset = (map_y & 7) * 8
+        entries = self.memory[map_base + (map_y >> 3) * 32:map_base + (map_y >> 3) * 32 + 32]
+        return b''.join([tiles[(index << 6) + row_offset:(index << 6) + row_offset + 8]
+                         for index in (tile_index(tile, lcdc) for tile in entries)])
+
+
+def create_renderer(memory, tile_cache, kind='auto'):
+    """
+    :param kind: 'numpy', 'python', or 'auto' for numpy when it is installed
+    """
+    if kind in ('auto', 'numpy'):
+        try:
+            from phase3.numpy_renderer import NumpyRenderer
+        except ImportError:
+            if kind == 'numpy':
+                raise
+        else:
+            return NumpyRenderer(memory, tile_cache)
+
+    if kind not in ('auto', 'python'):
+        raise ValueError(f"Unknown renderer: {kind}")
+    return PythonRenderer(memory, tile_cache)
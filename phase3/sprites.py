@@ -0,0 +1,66 @@
+OAM_START = 0xFE00
+SPRITE_COUNT = 40
+SPRITES_PER_LINE = 10
+
+# Attribute bits
+BG_PRIORITY = 0x80  # Behind background colours 1-3
+Y_FLIP = 0x40
+X_FLIP = 0x20
+PALETTE_1 = 0x10  # OBP1 instead of OBP0
+
+
+class SpriteIndex:
+    """
+    Sprites of every scanline, worked out from OAM in one pass.
+
+    A line holds the first 10 sprites in OAM order that cover it (off-screen X still counts
+    towards the limit), as (x, oam index, top, tile, attributes) sorted lowest priority first:
+    higher X, then higher OAM index, loses, so drawing the list in order leaves the winner on top.
+    ``update`` only rebuilds when OAM or the sprite height changed since the last call, so the cost
+    follows OAM writes and DMAs, not pixels.
+    """
+
+    def __init__(self, memory, screen_height):
+        self.screen_height = screen_height
+        self.oam = memoryview(memory)[OAM_START:OAM_START + 4 * SPRITE_COUNT]
+        self.snapshot = None
+        self.height = None
+        self.lines = [()] * screen_height
+        self.rebuilds = 0
+
+    def update(self, height):
+        if height == self.height and self.oam == self.snapshot:
+            return
+
+        self.snapshot = bytes(self.oam)
+        self.height = height
+        self.rebuilds += 1
+
+        lines = [[] for _ in range(self.screen_height)]
+        oam = self.snapshot
+        for index in range(SPRITE_COUNT):
+            y, x, tile, attributes = oam[4 * index:4 * index + 4]
+            top = y - 16
+            for ly in range(max(top, 0), min(top + height, self.screen_height)):
+                if len(lines[ly]) < SPRITES_PER_LINE:
+                    lines[ly].append((x, index, top, tile, attributes))
+
+        self.lines = [tuple(sorted(line, reverse=True)) for line in lines]
+
+
+def sprite_row(tiles, tile, row, attributes, height):
+    """
+    Colour indices of one row of a sprite from the tile cache, flips applied.
+
+    :param row: line within the sprite, 0 at its top
+    """
+    if attributes & Y_FLIP:
+        row = height - 1 - row
+    if height == 16:
+        # 8x16 sprites ignore bit 0 of the tile number
+        tile = (tile & 0xFE) | (row >> 3)
+        row &= 7
+
+    offset = (tile << 6) + row * 8
+    pixels = tiles[offset:offset + 8]
+    return pixels[::-1] if attributes & X_FLIP else pixels
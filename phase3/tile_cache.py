@@ -0,0 +1,58 @@
+TILE_DATA_START = 0x8000
+TILE_DATA_END = 0x9800
+TILE_COUNT = (TILE_DATA_END - TILE_DATA_START) // 16  # 384
+TILE_SIZE = 64  # 8x8 colour indices
+
+
+def spread(byte):
+    """
+    One bitplane byte -> 8 byte integer holding each bit in its own byte, leftmost pixel first.
+    """
+    return int.from_bytes(bytes((byte >> (7 - x)) & 1 for x in range(8)), 'big')
+
+
+SPREAD = [spread(byte) for byte in range(0x100)]
+
+
+class TileCache:
+    """
+    The 384 tiles of 0x8000-0x97FF decoded to colour indices (0-3), 64 bytes per tile, row by row.
+
+    VRAM tile data writes go through an MMU handler that only records which tile changed; dirty
+    tiles are decoded the next time a renderer calls ``update``, so an unchanged VRAM costs nothing.
+    """
+
+    def __init__(self, motherboard):
+        self.memory = motherboard.ram.memory
+        self.tiles = bytearray(TILE_COUNT * TILE_SIZE)
+        self.dirty = set(range(TILE_COUNT))
+        self.decoded = 0
+
+        motherboard.mmu.map_write_handler(TILE_DATA_START, TILE_DATA_END, self.write)
+
+    def write(self, address, value):
+        self.memory[address] = value
+        self.dirty.add((address - TILE_DATA_START) >> 4)
+
+    def invalidate(self):
+        """
+        Marks every tile dirty, for VRAM written behind the MMU's back (save state restore).
+        """
+        self.dirty.update(range(TILE_COUNT))
+
+    def update(self):
+        if not self.dirty:
+            return
+
+        memory = self.memory
+        tiles = self.tiles
+        for tile in self.dirty:
+            address = TILE_DATA_START + tile * 16
+            offset = tile * TILE_SIZE
+            for row in range(8):
+                low = memory[address + 2 * row]
+                high = memory[address + 2 * row + 1]
+                tiles[offset + 8 * row:offset + 8 * row + 8] = (SPREAD[low] | SPREAD[high] << 1).to_bytes(8, 'big')
+
+        self.decoded += len(self.dirty)
+        self.dirty.clear()
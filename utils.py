@@ -1,5 +1,8 @@
 import logging
+import mmap
+import os
 import sys
+from pathlib import Path
 
 logging.basicConfig(stream=sys.stdout,
                     level=logging.INFO,
@@ -19,3 +22,24 @@ def shift_left(val):
 def shift_right(val):
     return val >> 8
 
+
+def map_file(path):
+    """
+    Maps a ROM image read-only instead of reading it in. Pages come from the OS page cache, so any
+    number of instances and processes running the same ROM share one copy, and opening it costs the
+    same whatever its size. The caller owns the mapping: a Cartridge closes the one it was given
+    in close().
+
+    :return: mmap, indexes and slices like bytes
+    """
+    path = Path(path)
+    with open(path, mode='rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            # mmap can't map an empty file
+            raise ValueError(f"{path.name} is empty, not a ROM image")
+        # The mapping outlives the file descriptor
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    logging.info(f"Mapped {path.name}: {size} bytes")
+    return mapped